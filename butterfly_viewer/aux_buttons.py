@@ -12,8 +12,43 @@ Credits:
 
 
 
-from PyQt5.QtGui import QColor, QPalette, qGray
-from PyQt5.QtWidgets import QAbstractButton, QGraphicsColorizeEffect, QWidget, qApp, QPushButton, QToolButton
+from PyQt5.QtCore import QRectF, QSize, Qt
+from PyQt5.QtGui import QColor, QPainter, QPalette, QPixmap, QPixmapCache, qGray
+from PyQt5.QtSvg import QSvgRenderer
+from PyQt5.QtWidgets import QAbstractButton, QGraphicsColorizeEffect, QWidget, qApp, QPushButton, QToolButton, QStyle, QStyleOptionButton
+
+
+
+def svg_pixmap(path: str, size: QSize):
+    """Get an SVG rasterized to a given size, rendering it only if not already in the QPixmapCache.
+
+    The SVG keeps its aspect ratio and is centered in the pixmap.
+
+    Args:
+        path (str): Filepath or resource path of the SVG (for example, ":/icons/eye.svg").
+        size (QSize): Size of the pixmap in device pixels.
+
+    Returns:
+        pixmap (QPixmap): The rasterized SVG (null if the SVG is invalid or the size is empty).
+    """
+    key = f"{path}@{size.width()}x{size.height()}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is not None:
+        return pixmap
+
+    renderer = QSvgRenderer(path)
+    if not renderer.isValid() or size.isEmpty():
+        return QPixmap()
+
+    bounds = renderer.defaultSize().scaled(size, Qt.KeepAspectRatio)
+    pixmap = QPixmap(size)
+    pixmap.fill(Qt.transparent)
+    painter = QPainter(pixmap)
+    renderer.render(painter, QRectF((size.width() - bounds.width())/2, (size.height() - bounds.height())/2, bounds.width(), bounds.height()))
+    painter.end()
+
+    QPixmapCache.insert(key, pixmap)
+    return pixmap
 
 
 
@@ -43,6 +78,7 @@ class SvgAbstractButton(QAbstractButton):
         self.__initBackgroundDefault()
         self.__background_color = self.__background_color_default
         self.__icon = ''
+        self.__icon_css = '' # No image property without an icon, so QSS resolves no empty url() (as for the checked icon)
         self.__checked_icon = ''
         self.__checked_icon_css = ''
         self.__animation = ''
@@ -117,7 +153,7 @@ class SvgAbstractButton(QAbstractButton):
         border-color: transparent;
         width: {self.__size};
         height: {self.__size};
-        image: url({self.__icon});
+        {self.__icon_css}
         background-color: {self.__background_color};
         border-radius: {self.__border_radius};
         padding: {self.__padding};
@@ -151,6 +187,10 @@ class SvgAbstractButton(QAbstractButton):
 
     def setIcon(self, icon: str):
         self.__icon = icon
+        if self.__icon:
+            self.__icon_css = f'image: url({self.__icon});'
+        else:
+            self.__icon_css = ''
         self.__styleInit()
 
     def setCheckedIcon(self, icon: str=None):
@@ -295,11 +335,48 @@ class SvgToolButton(QToolButton, SvgAbstractButton):
 
 
 class ViewerButton(SvgButton):
-    """SvgButton with styles for Butterfly Viewer main interface."""
+    """SvgButton with styles for Butterfly Viewer main interface.
+    
+    Icons are painted from pixmaps shared via QPixmapCache instead of being set as a stylesheet image,
+    so each SVG is rasterized once per size rather than for every button and every restyle.
+    """
     def __init__(self, base_widget: QWidget = None, style: str="default", *args, **kwargs):
         super().__init__(base_widget, *args, **kwargs)
+        self._icon_path = ""
+        self._checked_icon_path = ""
         self.setStyle(style)
 
+    def setIcon(self, icon: str):
+        """str: Set the SVG icon (override to paint it from the pixmap cache)."""
+        self._icon_path = icon
+        self.update()
+
+    def setCheckedIcon(self, icon: str=None):
+        """str: Set the SVG icon shown while checked (override to paint it from the pixmap cache)."""
+        self._checked_icon_path = icon or ""
+        self.update()
+
+    def paintEvent(self, event):
+        """Override paintEvent to draw the icon from the pixmap cache within the contents of the styled button."""
+        super().paintEvent(event)
+
+        icon = self._icon_path
+        if self.isChecked() and self._checked_icon_path:
+            icon = self._checked_icon_path
+        if not icon:
+            return
+
+        option = QStyleOptionButton()
+        self.initStyleOption(option)
+        rect = self.style().subElementRect(QStyle.SE_PushButtonContents, option, self)
+        pixmap = svg_pixmap(icon, rect.size()*self.devicePixelRatioF())
+        if pixmap.isNull():
+            return
+
+        painter = QPainter(self)
+        painter.drawPixmap(rect, pixmap)
+        painter.end()
+
     def setStyle(self, style: str="default"):
         if "trigger" in style:
             if "severe" in style:
@@ -18,7 +18,7 @@ import time
 from PyQt5 import QtCore, QtGui, QtWidgets
 
 from aux_labels import FilenameLabel
-from aux_exif import get_exif_rotation_angle
+from aux_loading import read_oriented_image
 
 
 class ImageLabel(QtWidgets.QLabel):
@@ -366,14 +366,10 @@ class DragDropImageLabel(QtWidgets.QWidget):
         if self.show_filepath_while_loading:
             loading_text = loading_text.replace("...",  " '" + file_path.split("/")[-1] + "'...")
         self.display_loading_grayout(True, loading_text)
-        pixmap = QtGui.QPixmap(file_path)
+        pixmap = QtGui.QPixmap.fromImage(read_oriented_image(file_path)) # Turned upright by EXIF during decode
         if pixmap.depth() is 0:
             self.display_loading_grayout(False)
             return False
-        
-        angle = get_exif_rotation_angle(file_path)
-        if angle:
-            pixmap = pixmap.transformed(QtGui.QTransform().rotate(angle))
 
         self.set_image(pixmap)
         self.set_filename_label(file_path)
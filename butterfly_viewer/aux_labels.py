@@ -74,4 +74,122 @@ class FilenameLabel(QtWidgets.QLabel):
         if self.visibility_based_on_text:
             if text is None:
                 value = False
-        self.setVisible(value)
\ No newline at end of file
+        self.setVisible(value)
+
+
+class StaticTextLabel(QtWidgets.QWidget):
+    """Lightweight label which paints its text from a cached QStaticText layout.
+
+    Intended for short single-line text updated at high frequency (for example, mouse coordinates), 
+    for which a QLabel would redo its text layout on every change.
+    Styled as white text on a translucent black background.
+
+    Args:
+        text (str): The text to show.
+        point_size (float): The font size of the text in points.
+    """
+
+    def __init__(self, text="", point_size=7.5):
+        super().__init__()
+
+        self._margin = 1
+
+        palette = self.palette() # Colors by palette instead of stylesheet so no CSS is resolved on show/hide
+        palette.setColor(QtGui.QPalette.Window, QtGui.QColor(0, 0, 0, 191))
+        palette.setColor(QtGui.QPalette.WindowText, QtCore.Qt.white)
+        self.setPalette(palette)
+
+        self._font = QtGui.QFont(self.font()) # Held separately so the font is not overridden by stylesheets of parent widgets
+        self._font.setPointSizeF(point_size)
+
+        self._static_text = QtGui.QStaticText()
+        self._static_text.setTextFormat(QtCore.Qt.PlainText)
+        self.setText(text)
+
+    def text(self):
+        """str: The text of the label."""
+        return self._static_text.text()
+
+    def setText(self, text):
+        """str: Set the text of the label and repaint it, relaying out the text only if it changed."""
+        if text == self._static_text.text():
+            return
+        size_old = self._static_text.size()
+        self._static_text.setText(text)
+        self._static_text.prepare(QtGui.QTransform(), self._font)
+        if self._static_text.size() != size_old:
+            self.updateGeometry()
+        self.update()
+
+    def sizeHint(self):
+        """QSize: Override sizeHint to fit the text plus margins."""
+        size = self._static_text.size().toSize()
+        return size + QtCore.QSize(2*self._margin, 2*self._margin)
+
+    def paintEvent(self, event):
+        """Override paintEvent to draw the background and the static text."""
+        rect = self.rect().adjusted(self._margin, self._margin, -self._margin, -self._margin)
+        painter = QtGui.QPainter(self)
+        painter.fillRect(rect, self.palette().window())
+        painter.setFont(self._font)
+        painter.setPen(self.palette().color(QtGui.QPalette.WindowText))
+        painter.drawStaticText(rect.topLeft(), self._static_text)
+        painter.end()
+
+
+class GrayoutLabel(QtWidgets.QWidget):
+    """Label which grays out the area beneath it with centered, word-wrapped text.
+
+    Colored by QPalette (Window for the grayout; WindowText for the text) instead of a stylesheet,
+    so showing and hiding it does not resolve any CSS.
+
+    Args:
+        text (str): The text to show.
+        background_color (QColor): The color of the grayout (usually translucent).
+        is_bordered (bool): True to inset the grayout with a dashed gray rounded border (for example, a drop zone).
+        point_size (float): The font size of the text in points.
+    """
+
+    def __init__(self, text="", background_color=QtGui.QColor(0, 0, 0, 223), is_bordered=False, point_size=10):
+        super().__init__()
+
+        self._text = text
+        self._is_bordered = is_bordered
+
+        self._font = QtGui.QFont(self.font()) # Held separately so the font is not overridden by stylesheets of parent widgets
+        self._font.setPointSizeF(point_size)
+
+        palette = self.palette()
+        palette.setColor(QtGui.QPalette.Window, background_color)
+        palette.setColor(QtGui.QPalette.WindowText, QtCore.Qt.white)
+        self.setPalette(palette)
+        self.setAutoFillBackground(not is_bordered) # Bordered grayout is filled in paintEvent within its border
+
+    def text(self):
+        """str: The text of the label."""
+        return self._text
+
+    def setText(self, text):
+        """str: Set the text of the label and repaint it if it changed."""
+        if text == self._text:
+            return
+        self._text = text
+        self.update()
+
+    def paintEvent(self, event):
+        """Override paintEvent to draw the bordered grayout (if bordered) and the text."""
+        em = QtGui.QFontInfo(self._font).pixelSize() # Sizes in em as in the former stylesheet
+        rect = QtCore.QRectF(self.rect())
+        painter = QtGui.QPainter(self)
+        if self._is_bordered:
+            border = 0.13*em
+            inset = 0.25*em + border/2
+            rect.adjust(inset, inset, -inset, -inset)
+            painter.setRenderHint(QtGui.QPainter.Antialiasing)
+            painter.setPen(QtGui.QPen(QtGui.QColor("gray"), border, QtCore.Qt.DashLine))
+            painter.setBrush(self.palette().window())
+            painter.drawRoundedRect(rect, 0.25*em, 0.25*em)
+        painter.setFont(self._font)
+        painter.setPen(self.palette().color(QtGui.QPalette.WindowText))
+        painter.drawText(rect, QtCore.Qt.AlignCenter | QtCore.Qt.TextWordWrap, self._text)
+        painter.end()
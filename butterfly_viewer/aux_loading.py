@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+
+"""Background image decoding for Butterfly Viewer.
+
+Not intended as a script.
+
+Decoding happens on QThreadPool workers as QImage (which is safe off the GUI thread);
+conversion to QPixmap must remain on the GUI thread.
+"""
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from PyQt5 import QtCore, QtGui
+
+
+
+def read_oriented_image(path):
+    """Decode an image file to QImage turned upright by its EXIF orientation (safe on worker threads).
+
+    The orientation is read and applied by QImageReader as part of the decode (autoTransform), 
+    so the file is not reopened and parsed separately for EXIF.
+
+    Args:
+        path (str): The image filepath.
+
+    Returns:
+        image (QImage): The decoded image; null if unreadable.
+    """
+    reader = QtGui.QImageReader(path)
+    reader.setAutoTransform(True)
+    return reader.read()
+
+
+
+class ImageDecodeNotifier(QtCore.QObject):
+    """QObject carrying the signal of decoded images back to the GUI thread.
+
+    Instantiate on the GUI thread so that connected slots run there (queued).
+    """
+
+    decoded = QtCore.pyqtSignal(str, QtGui.QImage)
+
+
+
+class ImageDecodeRunnable(QtCore.QRunnable):
+    """QRunnable which decodes an image file to upright QImage on a worker thread.
+
+    Args:
+        path (str): The image filepath.
+        notifier (ImageDecodeNotifier): Emits the path and decoded image (null if unreadable) when done.
+    """
+
+    def __init__(self, path, notifier):
+        super().__init__()
+        self.path = path
+        self.notifier = notifier
+
+    def run(self):
+        """Decode and orient the image and emit it through the notifier."""
+        self.notifier.decoded.emit(self.path, read_oriented_image(self.path))
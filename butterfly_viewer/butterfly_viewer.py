@@ -21,18 +21,22 @@ import argparse
 import sip
 import time
 import os
+from collections import deque
+from contextlib import contextmanager
 from datetime import datetime
+from functools import reduce
 
 from PyQt5 import QtCore, QtGui, QtWidgets
 
 from aux_splitview import SplitView
-from aux_functions import strippedName, toBool, determineSyncSenderDimension, determineSyncAdjustmentFactor
+from aux_functions import strippedName, determineSyncSenderDimension, determineSyncAdjustmentFactor
 from aux_trackers import EventTrackerSplitBypassInterface
 from aux_interfaces import SplitViewCreator, SlidersOpacitySplitViews, SplitViewManager
 from aux_mdi import QMdiAreaWithCustomSignals
 from aux_layouts import GridLayoutFloatingShadow
-from aux_exif import get_exif_rotation_angle
 from aux_buttons import ViewerButton
+from aux_labels import StaticTextLabel, GrayoutLabel
+from aux_loading import ImageDecodeNotifier, ImageDecodeRunnable, read_oriented_image
 import icons_rc
 
 
@@ -54,12 +58,24 @@ DOMAIN = "https://github.com/olive-groves/butterfly_viewer/"
 APPNAME = "Butterfly Viewer"
 VERSION = "1.1"
 
+_HL_TRANSPARENT = "QFrame {border: 0px solid transparent}" # Highlight stylesheets of subwindows (inactive or quiet; split locked; active)
+_HL_LOCKED = "QFrame {border: 0.2em orange; border-left-style: outset; border-top-style: inset; border-right-style: inset; border-bottom-style: inset}"
+_HL_ACTIVE = "QFrame {border: 0.2em blue; border-left-style: outset; border-top-style: inset; border-right-style: inset; border-bottom-style: inset}"
+
 SETTING_RECENTFILELIST = "recentfilelist"
 SETTING_FILEOPEN = "fileOpenDialog"
 SETTING_SCROLLBARS = "scrollbars"
 SETTING_STATUSBAR = "statusbar"
 SETTING_SYNCHZOOM = "synchzoom"
 SETTING_SYNCHPAN = "synchpan"
+SETTING_PIXMAPCACHE = "pixmapcachelimit"
+SETTINGS_GROUP_MAINWINDOW = "MainWindow" # Group of the geometry, state, and view settings of the main window
+SETTINGS_KEYS_MAINWINDOW = ("pos", "size", "windowgeometry", "windowstate", 
+                            SETTING_SCROLLBARS, SETTING_STATUSBAR, SETTING_SYNCHZOOM, SETTING_SYNCHPAN) # Keys of the group; ungrouped in settings written by earlier versions
+
+PIXMAP_CACHE_LIMIT_DEFAULT = 262144 # KB; room for the shared interface icon pixmaps and recently loaded images
+
+LOAD_GRAYOUT_MIN_BYTES = 2_000_000 # Loads of smaller (or cached) images are too quick to be worth showing and hiding the loading grayout
 
 
 
@@ -76,6 +92,11 @@ class SplitViewMdiChild(SplitView):
     """
 
     shortcut_shift_x_was_activated = QtCore.pyqtSignal()
+    was_changed_sync_this = QtCore.pyqtSignal() # Whether this is synched by zoom or pan changed
+    was_changed_pan = QtCore.pyqtSignal(QtCore.QObject) # Scroll changed; carries this so receivers need no sender() lookup
+    was_changed_zoom = QtCore.pyqtSignal(QtCore.QObject) # Transform changed; carries this likewise
+
+    _SHORTCUT_LOCK_SPLIT = QtGui.QKeySequence("Shift+X") # Parsed once for all children
 
     def __init__(self, pixmap, filename_main_topleft, name, pixmap_topright, pixmap_bottomleft, pixmap_bottomright, transform_mode_smooth):
         super().__init__(pixmap, filename_main_topleft, name, pixmap_topright, pixmap_bottomleft, pixmap_bottomright, transform_mode_smooth)
@@ -83,11 +104,20 @@ class SplitViewMdiChild(SplitView):
         self.setAttribute(QtCore.Qt.WA_DeleteOnClose)
         self._isUntitled = True
 
-        self.toggle_lock_split_shortcut = QtWidgets.QShortcut(QtGui.QKeySequence("Shift+X"), self)
+        self.toggle_lock_split_shortcut = QtWidgets.QShortcut(self._SHORTCUT_LOCK_SPLIT, self)
         self.toggle_lock_split_shortcut.activated.connect(self.toggle_lock_split)
 
+        self.scrollChanged.connect(self.emit_was_changed_pan)
+        self.transformChanged.connect(self.emit_was_changed_zoom)
+
         self._sync_this_zoom = True
         self._sync_this_pan = True
+
+        self._cachedAdjKey = None # (sync_by, sender_dimension) of the cached zoom adjustment factor (see get_sync_adjustment_factor)
+        self._cachedAdjFactor = 1.0
+
+        self._cachedStatusFile = None # File of the cached status bar texts (see MultiViewMainWindow.getStatusBarFileTexts)
+        self._cachedStatusTexts = None
     
     @property
     def sync_this_zoom(self):
@@ -97,7 +127,9 @@ class SplitViewMdiChild(SplitView):
     @sync_this_zoom.setter
     def sync_this_zoom(self, bool: bool):
         """bool: Set whether to sync this by zoom (or not)."""
-        self._sync_this_zoom = bool
+        if bool != self._sync_this_zoom:
+            self._sync_this_zoom = bool
+            self.was_changed_sync_this.emit()
 
     @property
     def sync_this_pan(self):
@@ -107,7 +139,35 @@ class SplitViewMdiChild(SplitView):
     @sync_this_pan.setter
     def sync_this_pan(self, bool: bool):
         """bool: Set whether to sync this by pan (or not)."""
-        self._sync_this_pan = bool
+        if bool != self._sync_this_pan:
+            self._sync_this_pan = bool
+            self.was_changed_sync_this.emit()
+
+    def emit_was_changed_pan(self):
+        """Emit the change of scroll (pan) with this as the payload."""
+        self.was_changed_pan.emit(self)
+
+    def emit_was_changed_zoom(self):
+        """Emit the change of transform (zoom) with this as the payload."""
+        self.was_changed_zoom.emit(self)
+
+    def get_sync_adjustment_factor(self, sync_by, sender_dimension):
+        """Get the factor with which to multiply the zoom of a sender to sync this as receiver.
+
+        Cached until the sync method or the sender dimension changes (the dimensions of this image are fixed).
+        
+        Args:
+            sync_by (str): Method by which to sync zoom ("box", "width", "height", "pixel").
+            sender_dimension (int): Dimension of sender in pixels, as determined by determineSyncSenderDimension().
+
+        Returns:
+            adjustment_factor (float): Factor with which to multiply the sender zoom to sync this.
+        """
+        key = (sync_by, sender_dimension)
+        if key != self._cachedAdjKey:
+            self._cachedAdjFactor = determineSyncAdjustmentFactor(sync_by, sender_dimension, self.imageWidth, self.imageHeight)
+            self._cachedAdjKey = key
+        return self._cachedAdjFactor
 
     # Control the split of the sliding overlay
 
@@ -148,16 +208,62 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
     
     MaxRecentFiles = 10
 
+    _BUTTONS = ( # Interface buttons of the MDI area as (name, style, icon, checked icon, tooltip, checkable, signal, slots), created as self.<name>_pushbutton
+        ("fullscreen", "default", ":/icons/full-screen.svg", ":/icons/full-screen-exit.svg", "Fullscreen on/off (F)", True, "toggled", ("set_fullscreen",)),
+        ("interface_toggle", "default", ":/icons/eye-cancelled.svg", ":/icons/eye.svg", "Hide interface (H)", True, "clicked", ("show_interface",)),
+        ("close_all", "trigger-severe", ":/icons/clear.svg", None, "Close all image windows", False, "clicked", ("_mdiArea.closeAllSubWindows",)),
+        ("tile_default", "trigger", ":/icons/capacity.svg", None, "Grid arrange windows", False, "clicked", ("_mdiArea.tileSubWindows", "fit_to_window", "refreshPan")),
+        ("tile_horizontally", "trigger", ":/icons/split-vertically.svg", None, "Horizontally arrange windows in a single row", False, "clicked", ("_mdiArea.tile_subwindows_horizontally", "fit_to_window", "refreshPan")),
+        ("tile_vertically", "trigger", ":/icons/split-horizontally.svg", None, "Vertically arrange windows in a single column", False, "clicked", ("_mdiArea.tile_subwindows_vertically", "fit_to_window", "refreshPan")),
+        ("fit_to_window", "trigger", ":/icons/pan.svg", None, "Fit and center image in active window (affects all if synced)", False, "clicked", ("fit_to_window",)),
+        ("info", "trigger-transparent", ":/icons/about.svg", None, "About...", False, "clicked", ("info_button_clicked",)),
+        ("stopsync_toggle", "green-yellow", ":/icons/refresh.svg", ":/icons/refresh-cancelled.svg", "Unsynchronize zoom and pan (currently synced)", True, "toggled", ("set_stopsync_pushbutton",)),
+        ("save_view", "default", ":/icons/download.svg", None, "Save a screenshot of the viewer... | Copy screenshot to clipboard (Ctrl·C)", False, "clicked", ("save_view",)),
+        ("open_new", "default", ":/icons/open-file.svg", None, "Open image(s) as single windows...", False, "clicked", ("open_multiple",)),
+    )
+
+    _bg_brush = QtGui.QBrush(QtGui.QColor(32,32,32)) # Background of MDIArea
+
+    _SAVE_NAME_FILTERS = "PNG (*.png);; JPEG (*.jpeg);; TIFF (*.tiff);; JPG (*.jpg);; TIF (*.tif)" # Allows users to select filetype of screenshot
+
+    # Shortcuts parsed once at import (standard keys such as QKeySequence.Open are left as enums: they resolve by platform only once an application exists)
+    _SHORTCUT_SYSTEM_MENU = QtGui.QKeySequence("Ctrl+ ")
+    _SHORTCUT_CENTER = QtGui.QKeySequence("5")
+    _SHORTCUT_ACTUAL_SIZE = QtGui.QKeySequence("/")
+    _SHORTCUT_FIT_IMAGE = QtGui.QKeySequence("*")
+    _SHORTCUT_FIT_WIDTH = QtGui.QKeySequence("Alt+Right")
+    _SHORTCUT_FIT_HEIGHT = QtGui.QKeySequence("Alt+Down")
+
+    _ABOUT_HTML = "<br>".join([ # Text of the about box (built once at import)
+        APPNAME,
+        "Lars Maxfield",
+        "Version: " + VERSION,
+        "License: <a href='https://www.gnu.org/licenses/gpl-3.0.en.html'>GNU GPL v3</a> or later",
+        "Source: <a href='https://github.com/olive-groves/butterfly_viewer'>github.com/olive-groves/butterfly_viewer</a>",
+        "Tutorial: <a href='https://olive-groves.github.io/butterfly_viewer'>olive-groves.github.io/butterfly_viewer</a>",
+    ])
+
     def __init__(self):
         super(MultiViewMainWindow, self).__init__()
 
         self._recentFileActions = []
         self._handlingScrollChangedSignal = False
+        self._syncPending = False # Pan/zoom synch scheduled for the next event-loop tick (see _scheduleSync)
+        self._syncPanFrom = None
+        self._syncZoomFrom = None
         self._last_accessed_fullpath = None
 
         self._mdiArea = QMdiAreaWithCustomSignals()
         self._mdiArea.file_path_dragged.connect(self.display_dragged_grayout)
         self._mdiArea.file_path_dragged_and_dropped.connect(self.load_from_dragged_and_dropped_file)
+        self._pending_loads = [] # (filenames, paths still decoding, whether grayout shown) of each loadFile call, in call order
+        self._load_batch_depth = 0 # Depth of batched_loads; relayout is held while > 0
+        self._pending_tile_children = [] # New subwindow children awaiting one shared relayout
+        self._relayout_queued = False
+        self._paths_decoding = set()
+        self._decoded_pixmaps = {} # Background-decoded pixmaps by cache key, until loaded
+        self._image_decode_notifier = ImageDecodeNotifier(self)
+        self._image_decode_notifier.decoded.connect(self.on_image_decoded)
         self._mdiArea.shortcut_escape_was_activated.connect(self.set_fullscreen_off)
         self._mdiArea.shortcut_f_was_activated.connect(self.toggle_fullscreen)
         self._mdiArea.shortcut_h_was_activated.connect(self.toggle_interface)
@@ -167,33 +273,59 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
 
         self._mdiArea.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAsNeeded)
         self._mdiArea.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAsNeeded)
-        self._mdiArea.subWindowActivated.connect(self.subWindowActivated)
 
-        self._mdiArea.setBackground(QtGui.QColor(32,32,32))
+        self._mdiArea.setBackground(self._bg_brush)
 
-        self._label_mouse = QtWidgets.QLabel() # Pixel coordinates of mouse in a view
-        self._label_mouse.setText("")
+        self._label_mouse = StaticTextLabel() # Pixel coordinates of mouse in a view (text layout is cached because it changes on every mouse move)
         self._label_mouse.adjustSize()
         self._label_mouse.setVisible(False)
-        self._label_mouse.setAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignBottom)
-        self._label_mouse.setStyleSheet("QLabel {color: white; background-color: rgba(0, 0, 0, 191); border: 0px solid black; margin-left: 0.09em; margin-top: 0.09em; margin-right: 0.09em; margin-bottom: 0.09em; font-size: 7.5pt; border-radius: 0.09em; }")
+        self._last_shown_xy = None # Last shown pixel coordinates of mouse (see on_positionChanged)
+        self._last_label_len = 0
+
+        self._split_update_timer = QtCore.QTimer(self) # Throttles split updates from interface mouse moves to at most one per frame
+        self._split_update_timer.setSingleShot(True)
+        self._split_update_timer.setInterval(16)
+        self._split_update_timer.timeout.connect(self.update_split)
+
+        self._statusBarTimer = QtCore.QTimer(self) # Throttles status bar updates from zoom changes to at most one per frame
+        self._statusBarTimer.setSingleShot(True)
+        self._statusBarTimer.setInterval(16)
+        self._statusBarTimer.timeout.connect(self.updateStatusBar)
 
         self._splitview_creator = SplitViewCreator()
         self._splitview_creator.clicked_create_splitview_pushbutton.connect(self.on_create_splitview)
         tracker_creator = EventTrackerSplitBypassInterface(self._splitview_creator)
-        tracker_creator.mouse_position_changed.connect(self.update_split)
+        tracker_creator.mouse_position_changed.connect(self._schedule_split_update, QtCore.Qt.DirectConnection)
         layout_mdiarea_topleft = GridLayoutFloatingShadow()
         layout_mdiarea_topleft.addWidget(self._label_mouse, 1, 0, alignment=QtCore.Qt.AlignLeft|QtCore.Qt.AlignBottom)
         layout_mdiarea_topleft.addWidget(self._splitview_creator, 0, 0, alignment=QtCore.Qt.AlignLeft)
         self.interface_mdiarea_topleft = QtWidgets.QWidget()
         self.interface_mdiarea_topleft.setLayout(layout_mdiarea_topleft)
 
-        self._mdiArea.subWindowActivated.connect(self.update_sliders)
-        self._mdiArea.subWindowActivated.connect(self.update_window_highlight)
-        self._mdiArea.subWindowActivated.connect(self.update_window_labels)
-        self._mdiArea.subWindowActivated.connect(self.updateMenus)
-        self._mdiArea.subWindowActivated.connect(self.auto_tile_subwindows_on_close)
-        self._mdiArea.subWindowActivated.connect(self.update_mdi_buttons)
+        self._child_widgets = [] # SplitViewMdiChild of each subwindow, kept by createMdiChild and on_subwindow_closed to spare subWindowList() in loops
+        self._panReceivers = None # Children synched by pan, rebuilt from _child_widgets when invalidated (see invalidateSyncReceivers)
+        self._zoomReceivers = None
+        self._last_highlighted_window = None # Only subwindow with a highlight (see update_window_highlight)
+        self._labels_visible_window = None # Only subwindow with labels shown (see update_window_labels)
+        self._active_subwindow = None # Kept current by _on_subwindow_activated to spare lookups of the active subwindow
+        self._activeChild = None # Its widget (returned by activeMdiChild)
+        self._pending_active = None
+        self._active_view = None # Main view of the active child, cached for on_positionChanged
+        self._last_active_window = None # Subwindow for which the per-window state was last updated (see _on_active_subwindow_changed)
+        self._active_hold_depth = 0 # Depth of nested hold_active_updates()
+        self._active_update_held = False
+        self._activation_timer = QtCore.QTimer(self) # Coalesces bursts of subwindow activations (e.g., fast window flipping) into one update on the next event-loop tick
+        self._activation_timer.setSingleShot(True)
+        self._activation_timer.setInterval(0)
+        self._activation_timer.timeout.connect(self._on_activation_timer_timeout)
+        self._mdiArea.subWindowActivated.connect(self._on_subwindow_activated, QtCore.Qt.UniqueConnection) # Single dispatcher for all activation updates
+
+        self._pending_opacities = {} # Latest slider value per quadrant, applied by apply_pending_opacities
+        self._opacity_child = None # Subwindow child for which the values are pending
+        self._opacity_timer = QtCore.QTimer(self) # Limits transparency updates from slider drags to one per frame
+        self._opacity_timer.setSingleShot(True)
+        self._opacity_timer.setInterval(16)
+        self._opacity_timer.timeout.connect(self.apply_pending_opacities)
 
         self._sliders_opacity_splitviews = SlidersOpacitySplitViews()
         self._sliders_opacity_splitviews.was_changed_slider_base_value.connect(self.on_slider_opacity_base_changed)
@@ -201,7 +333,7 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
         self._sliders_opacity_splitviews.was_changed_slider_bottomright_value.connect(self.on_slider_opacity_bottomright_changed)
         self._sliders_opacity_splitviews.was_changed_slider_bottomleft_value.connect(self.on_slider_opacity_bottomleft_changed)
         tracker_sliders = EventTrackerSplitBypassInterface(self._sliders_opacity_splitviews)
-        tracker_sliders.mouse_position_changed.connect(self.update_split)
+        tracker_sliders.mouse_position_changed.connect(self._schedule_split_update, QtCore.Qt.DirectConnection)
 
         self._splitview_manager = SplitViewManager()
         self._splitview_manager.hovered_xy.connect(self.set_split_from_manager)
@@ -216,130 +348,26 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
         self.interface_mdiarea_bottomleft.setLayout(layout_mdiarea_bottomleft)
         
         
-        self.centralwidget_during_fullscreen_pushbutton = QtWidgets.QToolButton() # Needed for users to return the image viewer to the main window if the window of the viewer is lost during fullscreen
-        self.centralwidget_during_fullscreen_pushbutton.setText("Close Fullscreen") # Needed for users to return the image viewer to the main window if the window of the viewer is lost during fullscreen
-        self.centralwidget_during_fullscreen_pushbutton.clicked.connect(self.set_fullscreen_off)
-        self.centralwidget_during_fullscreen_pushbutton.setStyleSheet("font-size: 11pt")
-        self.centralwidget_during_fullscreen_layout = QtWidgets.QVBoxLayout()
-        self.centralwidget_during_fullscreen_layout.setAlignment(QtCore.Qt.AlignCenter)
-        self.centralwidget_during_fullscreen_layout.addWidget(self.centralwidget_during_fullscreen_pushbutton, alignment=QtCore.Qt.AlignCenter)
-        self.centralwidget_during_fullscreen = QtWidgets.QWidget()
-        self.centralwidget_during_fullscreen.setLayout(self.centralwidget_during_fullscreen_layout)
-
-        self.fullscreen_pushbutton = ViewerButton()
-        self.fullscreen_pushbutton.setIcon(":/icons/full-screen.svg")
-        self.fullscreen_pushbutton.setCheckedIcon(":/icons/full-screen-exit.svg")
-        self.fullscreen_pushbutton.setToolTip("Fullscreen on/off (F)")
-        self.fullscreen_pushbutton.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
-        self.fullscreen_pushbutton.setMouseTracking(True)
-        self.fullscreen_pushbutton.setCheckable(True)
-        self.fullscreen_pushbutton.toggled.connect(self.set_fullscreen)
-        self.is_fullscreen = False
-
-        self.interface_toggle_pushbutton = ViewerButton()
-        self.interface_toggle_pushbutton.setCheckedIcon(":/icons/eye.svg")
-        self.interface_toggle_pushbutton.setIcon(":/icons/eye-cancelled.svg")
-        self.interface_toggle_pushbutton.setToolTip("Hide interface (H)")
-        self.interface_toggle_pushbutton.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
-        self.interface_toggle_pushbutton.setMouseTracking(True)
-        self.interface_toggle_pushbutton.setCheckable(True)
-        self.interface_toggle_pushbutton.setChecked(True)
-        self.interface_toggle_pushbutton.clicked.connect(self.show_interface)
+        self._centralwidget_during_fullscreen = None # Built on first fullscreen; see centralwidget_during_fullscreen
 
+        self.is_fullscreen = False
         self.is_interface_showing = True
         self.is_quiet_mode = False
         self.is_global_transform_mode_smooth = False
         self.scene_background_color = None
         self.sync_zoom_by = "box"
 
-        self.close_all_pushbutton = ViewerButton(style="trigger-severe")
-        self.close_all_pushbutton.setIcon(":/icons/clear.svg")
-        self.close_all_pushbutton.setToolTip("Close all image windows")
-        self.close_all_pushbutton.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
-        self.close_all_pushbutton.setMouseTracking(True)
-        self.close_all_pushbutton.clicked.connect(self._mdiArea.closeAllSubWindows)
-
-        self.tile_default_pushbutton = ViewerButton(style="trigger")
-        self.tile_default_pushbutton.setIcon(":/icons/capacity.svg")
-        self.tile_default_pushbutton.setToolTip("Grid arrange windows")
-        self.tile_default_pushbutton.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
-        self.tile_default_pushbutton.setMouseTracking(True)
-        self.tile_default_pushbutton.clicked.connect(self._mdiArea.tileSubWindows)
-        self.tile_default_pushbutton.clicked.connect(self.fit_to_window)
-        self.tile_default_pushbutton.clicked.connect(self.refreshPan)
-
-        self.tile_horizontally_pushbutton = ViewerButton(style="trigger")
-        self.tile_horizontally_pushbutton.setIcon(":/icons/split-vertically.svg")
-        self.tile_horizontally_pushbutton.setToolTip("Horizontally arrange windows in a single row")
-        self.tile_horizontally_pushbutton.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
-        self.tile_horizontally_pushbutton.setMouseTracking(True)
-        self.tile_horizontally_pushbutton.clicked.connect(self._mdiArea.tile_subwindows_horizontally)
-        self.tile_horizontally_pushbutton.clicked.connect(self.fit_to_window)
-        self.tile_horizontally_pushbutton.clicked.connect(self.refreshPan)
-
-        self.tile_vertically_pushbutton = ViewerButton(style="trigger")
-        self.tile_vertically_pushbutton.setIcon(":/icons/split-horizontally.svg")
-        self.tile_vertically_pushbutton.setToolTip("Vertically arrange windows in a single column")
-        self.tile_vertically_pushbutton.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
-        self.tile_vertically_pushbutton.setMouseTracking(True)
-        self.tile_vertically_pushbutton.clicked.connect(self._mdiArea.tile_subwindows_vertically)
-        self.tile_vertically_pushbutton.clicked.connect(self.fit_to_window)
-        self.tile_vertically_pushbutton.clicked.connect(self.refreshPan)
-
-        self.fit_to_window_pushbutton = ViewerButton(style="trigger")
-        self.fit_to_window_pushbutton.setIcon(":/icons/pan.svg")
-        self.fit_to_window_pushbutton.setToolTip("Fit and center image in active window (affects all if synced)")
-        self.fit_to_window_pushbutton.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
-        self.fit_to_window_pushbutton.setMouseTracking(True)
-        self.fit_to_window_pushbutton.clicked.connect(self.fit_to_window)
-
-        self.info_pushbutton = ViewerButton(style="trigger-transparent")
-        self.info_pushbutton.setIcon(":/icons/about.svg")
-        self.info_pushbutton.setToolTip("About...")
-        self.info_pushbutton.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
-        self.info_pushbutton.setMouseTracking(True)
-        self.info_pushbutton.clicked.connect(self.info_button_clicked)
-
-        self.stopsync_toggle_pushbutton = ViewerButton(style="green-yellow")
-        self.stopsync_toggle_pushbutton.setIcon(":/icons/refresh.svg")
-        self.stopsync_toggle_pushbutton.setCheckedIcon(":/icons/refresh-cancelled.svg")
-        self.stopsync_toggle_pushbutton.setToolTip("Unsynchronize zoom and pan (currently synced)")
-        self.stopsync_toggle_pushbutton.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
-        self.stopsync_toggle_pushbutton.setMouseTracking(True)
-        self.stopsync_toggle_pushbutton.setCheckable(True)
-        self.stopsync_toggle_pushbutton.toggled.connect(self.set_stopsync_pushbutton)
-
-        self.save_view_pushbutton = ViewerButton()
-        self.save_view_pushbutton.setIcon(":/icons/download.svg")
-        self.save_view_pushbutton.setToolTip("Save a screenshot of the viewer... | Copy screenshot to clipboard (Ctrl·C)")
-        self.save_view_pushbutton.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
-        self.save_view_pushbutton.setMouseTracking(True)
-        self.save_view_pushbutton.clicked.connect(self.save_view)
-
-        self.open_new_pushbutton = ViewerButton()
-        self.open_new_pushbutton.setIcon(":/icons/open-file.svg")
-        self.open_new_pushbutton.setToolTip("Open image(s) as single windows...")
-        self.open_new_pushbutton.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
-        self.open_new_pushbutton.setMouseTracking(True)
-        self.open_new_pushbutton.clicked.connect(self.open_multiple)
+        for name, *spec in self._BUTTONS:
+            setattr(self, name + "_pushbutton", self._make_button(*spec))
+        self.interface_toggle_pushbutton.setChecked(True)
 
         self.buffer_label = ViewerButton(style="invisible")
         self.buffer_label.setAttribute(QtCore.Qt.WA_TransparentForMouseEvents)
         self.buffer_label.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
-        self.buffer_label.setMouseTracking(True)
-
-        self.label_mdiarea = QtWidgets.QLabel()
-        self.label_mdiarea.setText("Drag images directly to create individual image windows\n\n—\n\nCreate sliding overlays to compare images directly over each other\n\n—\n\nRight-click image windows to change settings and add tools")
-        self.label_mdiarea.setStyleSheet("""
-            QLabel { 
-                color: white;
-                border: 0.13em dashed gray;
-                border-radius: 0.25em;
-                background-color: transparent;
-                padding: 1em;
-                font-size: 10pt;
-                } 
-            """)
+
+        self._instructions_pixmap = self._render_instructions_pixmap("Drag images directly to create individual image windows\n\n—\n\nCreate sliding overlays to compare images directly over each other\n\n—\n\nRight-click image windows to change settings and add tools")
+        self.label_mdiarea = QtWidgets.QLabel() # Shows the pre-rendered instructions; no stylesheet to recompute when toggled
+        self.label_mdiarea.setPixmap(self._instructions_pixmap)
         self.label_mdiarea.setAttribute(QtCore.Qt.WA_TransparentForMouseEvents)
         self.label_mdiarea.setAlignment(QtCore.Qt.AlignCenter)
 
@@ -354,7 +382,7 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
         self.interface_mdiarea_bottomright_vertical = QtWidgets.QWidget()
         self.interface_mdiarea_bottomright_vertical.setLayout(layout_mdiarea_bottomright_vertical)
         tracker_interface_mdiarea_bottomright_vertical = EventTrackerSplitBypassInterface(self.interface_mdiarea_bottomright_vertical)
-        tracker_interface_mdiarea_bottomright_vertical.mouse_position_changed.connect(self.update_split)
+        tracker_interface_mdiarea_bottomright_vertical.mouse_position_changed.connect(self._schedule_split_update, QtCore.Qt.DirectConnection)
 
         layout_mdiarea_bottomright_horizontal = GridLayoutFloatingShadow()
         layout_mdiarea_bottomright_horizontal.addWidget(self.buffer_label, 0, 6)
@@ -367,48 +395,24 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
         self.interface_mdiarea_bottomright_horizontal = QtWidgets.QWidget()
         self.interface_mdiarea_bottomright_horizontal.setLayout(layout_mdiarea_bottomright_horizontal)
         tracker_interface_mdiarea_bottomright_horizontal = EventTrackerSplitBypassInterface(self.interface_mdiarea_bottomright_horizontal)
-        tracker_interface_mdiarea_bottomright_horizontal.mouse_position_changed.connect(self.update_split)
-
-
-        self.loading_grayout_label = QtWidgets.QLabel("Loading...") # Needed to give users feedback when loading views
-        self.loading_grayout_label.setWordWrap(True)
-        self.loading_grayout_label.setAlignment(QtCore.Qt.AlignCenter | QtCore.Qt.AlignVCenter)
-        self.loading_grayout_label.setVisible(False)
-        self.loading_grayout_label.setStyleSheet("""
-            QLabel { 
-                color: white;
-                background-color: rgba(0,0,0,223);
-                font-size: 10pt;
-                } 
-            """)
-
-        self.dragged_grayout_label = QtWidgets.QLabel("Drop to create single view(s)...") # Needed to give users feedback when dragging in images
-        self.dragged_grayout_label.setAttribute(QtCore.Qt.WA_TransparentForMouseEvents)
-        self.dragged_grayout_label.setWordWrap(True)
-        self.dragged_grayout_label.setAlignment(QtCore.Qt.AlignCenter | QtCore.Qt.AlignVCenter)
-        self.dragged_grayout_label.setVisible(False)
-        self.dragged_grayout_label.setStyleSheet("""
-            QLabel { 
-                color: white;
-                background-color: rgba(63,63,63,223);
-                border: 0.13em dashed gray;
-                border-radius: 0.25em;
-                margin-left: 0.25em;
-                margin-top: 0.25em;
-                margin-right: 0.25em;
-                margin-bottom: 0.25em;
-                font-size: 10pt;
-                } 
-            """)    
+        tracker_interface_mdiarea_bottomright_horizontal.mouse_position_changed.connect(self._schedule_split_update, QtCore.Qt.DirectConnection)
+
+        self._hover_hosts = (self.interface_mdiarea_bottomright_vertical, self.interface_mdiarea_bottomright_horizontal)
+        for host in self._hover_hosts: # Hover over buttons is tracked by one event filter (eventFilter) instead of per-button mouse tracking
+            for button in host.findChildren(ViewerButton):
+                button.setAttribute(QtCore.Qt.WA_Hover)
+                button.installEventFilter(self)
 
 
+        self._loading_grayout_label = None # Built on first use; see loading_grayout_label
+        self._dragged_grayout_label = None # Built on first use; see dragged_grayout_label
+        self._dragged_visible = False
+
         layout_mdiarea = QtWidgets.QGridLayout()
         layout_mdiarea.setContentsMargins(0, 0, 0, 0)
         layout_mdiarea.setSpacing(0)
         layout_mdiarea.addWidget(self._mdiArea, 0, 0)
         layout_mdiarea.addWidget(self.label_mdiarea, 0, 0, QtCore.Qt.AlignCenter)
-        layout_mdiarea.addWidget(self.dragged_grayout_label, 0, 0)
-        layout_mdiarea.addWidget(self.loading_grayout_label, 0, 0)
         layout_mdiarea.addWidget(self.interface_mdiarea_topleft, 0, 0, QtCore.Qt.AlignTop | QtCore.Qt.AlignLeft)
         layout_mdiarea.addWidget(self.interface_mdiarea_bottomleft, 0, 0, QtCore.Qt.AlignBottom | QtCore.Qt.AlignLeft)
         layout_mdiarea.addWidget(self.interface_mdiarea_bottomright_horizontal, 0, 0, QtCore.Qt.AlignBottom | QtCore.Qt.AlignRight)
@@ -416,24 +420,25 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
 
         self.mdiarea_plus_buttons = QtWidgets.QWidget()
         self.mdiarea_plus_buttons.setLayout(layout_mdiarea)
+        self._layout_mdiarea = layout_mdiarea # Kept for the grayout labels, which are added on first use
 
-        self.setCentralWidget(self.mdiarea_plus_buttons)
+        self._central_stack = QtWidgets.QStackedWidget() # Holds the MDI area and the interim widget of fullscreen so that toggling fullscreen only flips the current widget
+        self._central_stack.addWidget(self.mdiarea_plus_buttons)
+        self.setCentralWidget(self._central_stack)
 
         self.subwindow_was_just_closed = False
 
-        self._windowMapper = QtCore.QSignalMapper(self)
+        self._windowActionCache = {} # QAction of each subwindow in the Window menu, keyed by QMdiSubWindow (see updateWindowMenu)
 
         self._actionMapper = QtCore.QSignalMapper(self)
         self._actionMapper.mapped[str].connect(self.mappedImageViewerAction)
-        self._recentFileMapper = QtCore.QSignalMapper(self)
-        self._recentFileMapper.mapped[str].connect(self.openRecentFile)
 
         self.createActions()
         self.addAction(self._activateSubWindowSystemMenuAct)
 
         self.createMenus()
         self.updateMenus()
-        self.createStatusBar()
+        self._sbLabelName = None # Status bar labels are created on first show of the status bar (see _ensureStatusBar)
 
         self.readSettings()
         self.updateStatusBar()
@@ -446,6 +451,33 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
         self.setStyleSheet("QWidget{font-size: 9pt}")
 
 
+    def _make_button(self, style, icon, checked_icon, tooltip, checkable, signal, slots):
+        """Create an interface button from its specification in _BUTTONS.
+
+        Args:
+            style (str): The style of the ViewerButton.
+            icon (str): The resource path of the SVG icon.
+            checked_icon (str): The resource path of the SVG icon when checked (None for same as icon).
+            tooltip (str): The tooltip of the button.
+            checkable (bool): True if the button can be checked (toggled).
+            signal (str): The name of the button signal to connect ("clicked" or "toggled").
+            slots (tuple): The names of the methods to connect, relative to self (for example, "_mdiArea.tileSubWindows").
+
+        Returns:
+            button (ViewerButton): The button.
+        """
+        button = ViewerButton(style=style)
+        button.setIcon(icon)
+        if checked_icon:
+            button.setCheckedIcon(checked_icon)
+        button.setToolTip(tooltip)
+        button.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        button.setCheckable(checkable)
+        for slot in slots:
+            getattr(button, signal).connect(reduce(getattr, slot.split("."), self))
+        return button
+
+
     # Screenshot window
 
     def copy_view(self):
@@ -474,10 +506,10 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
 
         folderpath = None
 
-        if self.activeMdiChild:
-            folderpath = self.activeMdiChild.currentFile
+        child = self.activeMdiChild
+        if child:
+            folderpath = child.currentFile
             folderpath = os.path.dirname(folderpath)
-            folderpath = folderpath + "\\"
         else:
             self.display_loading_grayout(False, pseudo_load_time=0)
             return
@@ -490,11 +522,10 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
 
         date_and_time = datetime.now().strftime('%Y-%m-%d %H%M%S') # Sets the default filename with date and time 
         filename = "Viewer screenshot " + date_and_time + ".png"
-        name_filters = "PNG (*.png);; JPEG (*.jpeg);; TIFF (*.tiff);; JPG (*.jpg);; TIF (*.tif)" # Allows users to select filetype of screenshot
 
         self.display_loading_grayout(True, "Selecting folder and name for the viewer screenshot...", pseudo_load_time=0)
         
-        filepath, _ = QtWidgets.QFileDialog.getSaveFileName(self, "Save a screenshot of the viewer", folderpath+filename, name_filters)
+        filepath, _ = QtWidgets.QFileDialog.getSaveFileName(self, "Save a screenshot of the viewer", os.path.join(folderpath, filename), self._SAVE_NAME_FILTERS)
         _, fileextension = os.path.splitext(filepath)
         fileextension = fileextension.replace('.','')
         if filepath:
@@ -508,6 +539,45 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
     
     # Interface and appearance
 
+    @property
+    def centralwidget_during_fullscreen(self):
+        """QWidget: Interim central widget shown in the main window during fullscreen, built on first access."""
+        if self._centralwidget_during_fullscreen is None:
+            self.centralwidget_during_fullscreen_pushbutton = QtWidgets.QToolButton() # Needed for users to return the image viewer to the main window if the window of the viewer is lost during fullscreen
+            self.centralwidget_during_fullscreen_pushbutton.setText("Close Fullscreen") # Needed for users to return the image viewer to the main window if the window of the viewer is lost during fullscreen
+            self.centralwidget_during_fullscreen_pushbutton.clicked.connect(self.set_fullscreen_off)
+            self.centralwidget_during_fullscreen_pushbutton.setStyleSheet("font-size: 11pt")
+            self.centralwidget_during_fullscreen_layout = QtWidgets.QVBoxLayout()
+            self.centralwidget_during_fullscreen_layout.setAlignment(QtCore.Qt.AlignCenter)
+            self.centralwidget_during_fullscreen_layout.addWidget(self.centralwidget_during_fullscreen_pushbutton, alignment=QtCore.Qt.AlignCenter)
+            self._centralwidget_during_fullscreen = QtWidgets.QWidget()
+            self._centralwidget_during_fullscreen.setLayout(self.centralwidget_during_fullscreen_layout)
+            self._central_stack.addWidget(self._centralwidget_during_fullscreen) # Stays in the stack; never reparented
+        return self._centralwidget_during_fullscreen
+
+    @property
+    def loading_grayout_label(self):
+        """GrayoutLabel: Grayout over the MDIArea for loading sequences, built on first access."""
+        if self._loading_grayout_label is None:
+            label = GrayoutLabel("Loading...") # Needed to give users feedback when loading views
+            label.setVisible(False)
+            self._layout_mdiarea.addWidget(label, 0, 0)
+            label.stackUnder(self.interface_mdiarea_topleft) # Keep interface above grayout as if added in __init__
+            self._loading_grayout_label = label
+        return self._loading_grayout_label
+
+    @property
+    def dragged_grayout_label(self):
+        """GrayoutLabel: Grayout over the MDIArea for drag-and-drop sequences, built on first access."""
+        if self._dragged_grayout_label is None:
+            label = GrayoutLabel("Drop to create single view(s)...", QtGui.QColor(63,63,63,223), is_bordered=True) # Needed to give users feedback when dragging in images
+            label.setAttribute(QtCore.Qt.WA_TransparentForMouseEvents)
+            label.setVisible(False)
+            self._layout_mdiarea.addWidget(label, 0, 0)
+            label.stackUnder(self._loading_grayout_label or self.interface_mdiarea_topleft) # Loading grayout stays on top of dragged grayout
+            self._dragged_grayout_label = label
+        return self._dragged_grayout_label
+
     def display_loading_grayout(self, boolean, text="Loading...", pseudo_load_time=0.2):
         """Show/hide grayout screen for loading sequences.
 
@@ -518,8 +588,9 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
         """ 
         if not boolean:
             text = "Loading..."
-        self.loading_grayout_label.setText(text)
-        self.loading_grayout_label.setVisible(boolean)
+        if boolean or self._loading_grayout_label is not None: # No need to build the grayout just to hide it
+            self.loading_grayout_label.setText(text)
+            self.loading_grayout_label.setVisible(boolean)
         if boolean:
             self.loading_grayout_label.repaint()
         if not boolean:
@@ -531,10 +602,47 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
         Args:
             boolean (bool): True to show grayout; False to hide.
         """ 
+        if boolean == self._dragged_visible: # Drag events repeat; only act (and repaint) on a change
+            return
+        self._dragged_visible = boolean
         self.dragged_grayout_label.setVisible(boolean)
         if boolean:
             self.dragged_grayout_label.repaint()
 
+    def _render_instructions_pixmap(self, text):
+        """Render the instructions of the MDIArea once as a pixmap: white 10pt text in a dashed gray rounded border.
+
+        Args:
+            text (str): The instructions.
+
+        Returns:
+            pixmap (QPixmap): The rendered instructions at the device pixel ratio of the screen.
+        """
+        font = QtGui.QFont(self.font())
+        font.setPointSizeF(10)
+        em = QtGui.QFontInfo(font).pixelSize() # Sizes as in the former stylesheet: border 0.13em, radius 0.25em, padding 1em
+        border = 0.13*em
+        inset = border + em
+
+        text_rect = QtGui.QFontMetricsF(font).boundingRect(QtCore.QRectF(0, 0, 10000, 10000), QtCore.Qt.AlignCenter, text)
+        size = text_rect.size() + QtCore.QSizeF(2*inset, 2*inset)
+        dpr = self.devicePixelRatioF()
+        
+        pixmap = QtGui.QPixmap((size*dpr).toSize())
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(QtCore.Qt.transparent)
+
+        painter = QtGui.QPainter(pixmap)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        painter.setPen(QtGui.QPen(QtGui.QColor("gray"), border, QtCore.Qt.DashLine))
+        painter.drawRoundedRect(QtCore.QRectF(QtCore.QPointF(0, 0), size).adjusted(border/2, border/2, -border/2, -border/2), 0.25*em, 0.25*em)
+        painter.setPen(QtGui.QColor("white"))
+        painter.setFont(font)
+        painter.drawText(QtCore.QRectF(QtCore.QPointF(0, 0), size).adjusted(inset, inset, -inset, -inset), QtCore.Qt.AlignCenter, text)
+        painter.end()
+
+        return pixmap
+
     def on_last_remaining_subwindow_was_closed(self):
         """Show instructions label of MDIArea."""
         self.label_mdiarea.setVisible(True)
@@ -562,10 +670,11 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
         self.is_interface_showing = True
         self.is_quiet_mode = False
 
-        self.update_window_highlight(self._mdiArea.activeSubWindow())
-        self.update_window_labels(self._mdiArea.activeSubWindow())
-        self.set_window_close_pushbuttons_always_visible(self._mdiArea.activeSubWindow(), True)
-        self.set_window_mouse_rect_visible(self._mdiArea.activeSubWindow(), True)
+        window = self._active_subwindow
+        self.update_window_highlight(window)
+        self.update_window_labels(window)
+        self.set_window_close_pushbuttons_always_visible(window, True)
+        self.set_window_mouse_rect_visible(window, True)
         self.interface_mdiarea_topleft.setVisible(True)
         self.interface_mdiarea_bottomleft.setVisible(True)
 
@@ -582,10 +691,11 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
         self.is_interface_showing = False
         self.is_quiet_mode = True
 
-        self.update_window_highlight(self._mdiArea.activeSubWindow())
-        self.update_window_labels(self._mdiArea.activeSubWindow())
-        self.set_window_close_pushbuttons_always_visible(self._mdiArea.activeSubWindow(), False)
-        self.set_window_mouse_rect_visible(self._mdiArea.activeSubWindow(), False)
+        window = self._active_subwindow
+        self.update_window_highlight(window)
+        self.update_window_labels(window)
+        self.set_window_close_pushbuttons_always_visible(window, False)
+        self.set_window_mouse_rect_visible(window, False)
         self.interface_mdiarea_topleft.setVisible(False)
         self.interface_mdiarea_bottomleft.setVisible(False)
 
@@ -612,8 +722,9 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
         self._synchPanAct.setChecked(not boolean)
         
         if self._synchZoomAct.isChecked():
-            if self.activeMdiChild:
-                self.activeMdiChild.fitToWindow()
+            child = self.activeMdiChild
+            if child:
+                child.fitToWindow()
 
         if boolean:
             self.stopsync_toggle_pushbutton.setToolTip("Synchronize zoom and pan (currently unsynced)")
@@ -641,18 +752,18 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
         centralwidget_to_be_made_fullscreen = self.mdiarea_plus_buttons
         widget_to_replace_central = self.centralwidget_during_fullscreen
 
+        self._central_stack.removeWidget(centralwidget_to_be_made_fullscreen)
         centralwidget_to_be_made_fullscreen.setParent(None)
 
         # move() is needed when using multiple monitors because when the widget loses its parent, its position moves to the primary screen origin (0,0) instead of retaining the app's screen
         # The solution is to move the widget to the position of the app window and then make the widget fullscreen
         # A timer is needed for showFullScreen() to apply on the app's screen (otherwise the command is made before the widget's move is established)
         centralwidget_to_be_made_fullscreen.move(position_of_window)
-        QtCore.QTimer.singleShot(50, centralwidget_to_be_made_fullscreen.showFullScreen)
+        QtCore.QTimer.singleShot(50, QtCore.Qt.CoarseTimer, centralwidget_to_be_made_fullscreen.showFullScreen)
 
         self.showMinimized()
 
-        self.setCentralWidget(widget_to_replace_central)
-        widget_to_replace_central.show()
+        self._central_stack.setCurrentWidget(widget_to_replace_central)
         
         self._mdiArea.tile_what_was_done_last_time()
         self._mdiArea.activateWindow()
@@ -661,13 +772,14 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
         if self.fullscreen_pushbutton:
             self.fullscreen_pushbutton.setChecked(True)
 
-        if self.activeMdiChild:
-            self.synchPan(self.activeMdiChild)
+        child = self.activeMdiChild
+        if child:
+            self.synchPan(child)
 
     def set_fullscreen_off(self):
         """Disable fullscreen of MultiViewMainWindow.
         
-        Removes interim widget in main window. 
+        Switches the main window from the interim widget back to the MDIArea.
         Returns MDIArea to normal (non-fullscreen) view on main window. 
         """
         if not self.is_fullscreen:
@@ -675,13 +787,7 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
         
         self.showNormal()
 
-        fullscreenwidget_to_be_made_central = self.mdiarea_plus_buttons
-        centralwidget_to_be_hidden = self.centralwidget_during_fullscreen
-
-        centralwidget_to_be_hidden.setParent(None)
-        centralwidget_to_be_hidden.hide()
-
-        self.setCentralWidget(fullscreenwidget_to_be_made_central)
+        self.return_mdiarea_to_central_stack()
 
         self._mdiArea.tile_what_was_done_last_time()
         self._mdiArea.activateWindow()
@@ -693,6 +799,11 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
 
         self.refreshPanDelayed(100)
 
+    def return_mdiarea_to_central_stack(self):
+        """Return the MDI area (made fullscreen as its own window) to the main window as the current central widget."""
+        self._central_stack.insertWidget(0, self.mdiarea_plus_buttons)
+        self._central_stack.setCurrentIndex(0)
+
     def set_fullscreen(self, boolean):
         """Enable/disable fullscreen of MultiViewMainWindow.
         
@@ -709,52 +820,69 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
 
         Input window should be the subwindow which is active.
         All other subwindow(s) will be shown no highlight.
+        Only the previously highlighted subwindow is reset (no other subwindow has a highlight) and 
+        stylesheets are set only if they change.
         
         Args:
             window (QMdiSubWindow): The active subwindow to show highlight and indicate as active.
         """
         if window is None:
             return
-        changed_window = window
         if self.is_quiet_mode:
-            changed_window.widget().frame_hud.setStyleSheet("QFrame {border: 0px solid transparent}")
-        elif self.activeMdiChild.split_locked:
-            changed_window.widget().frame_hud.setStyleSheet("QFrame {border: 0.2em orange; border-left-style: outset; border-top-style: inset; border-right-style: inset; border-bottom-style: inset}")
+            style = _HL_TRANSPARENT
+        elif window.widget().split_locked:
+            style = _HL_LOCKED
         else:
-            changed_window.widget().frame_hud.setStyleSheet("QFrame {border: 0.2em blue; border-left-style: outset; border-top-style: inset; border-right-style: inset; border-bottom-style: inset}")
+            style = _HL_ACTIVE
 
-        windows = self._mdiArea.subWindowList()
-        for window in windows:
-            if window != changed_window:
-                window.widget().frame_hud.setStyleSheet("QFrame {border: 0px solid transparent}")
+        previous = self._last_highlighted_window
+        if previous is not None and previous is not window and not sip.isdeleted(previous) and previous.widget():
+            frame = previous.widget().frame_hud
+            with QtCore.QSignalBlocker(frame):
+                frame.setStyleSheet(_HL_TRANSPARENT)
+
+        frame = window.widget().frame_hud
+        if frame.styleSheet() != style:
+            with QtCore.QSignalBlocker(frame):
+                frame.setStyleSheet(style)
+        self._last_highlighted_window = window
 
     def update_window_labels(self, window):
         """Update labels of subwindows in MDIArea.
 
         Input window should be the subwindow which is active.
         All other subwindow(s) will be shown no labels.
+        Only the previously labeled subwindow is hidden (no other subwindow shows labels).
         
         Args:
             window (QMdiSubWindow): The active subwindow to show label(s) of image(s) and indicate as active.
         """
         if window is None:
             return
-        changed_window = window
         label_visible = True
         if self.is_quiet_mode:
             label_visible = False
-        changed_window.widget().label_main_topleft.set_visible_based_on_text(label_visible)
-        changed_window.widget().label_topright.set_visible_based_on_text(label_visible)
-        changed_window.widget().label_bottomright.set_visible_based_on_text(label_visible)
-        changed_window.widget().label_bottomleft.set_visible_based_on_text(label_visible)
 
-        windows = self._mdiArea.subWindowList()
-        for window in windows:
-            if window != changed_window:
-                window.widget().label_main_topleft.set_visible_based_on_text(False)
-                window.widget().label_topright.set_visible_based_on_text(False)
-                window.widget().label_bottomright.set_visible_based_on_text(False)
-                window.widget().label_bottomleft.set_visible_based_on_text(False)
+        previous = self._labels_visible_window
+        if previous is not None and previous is not window and not sip.isdeleted(previous) and previous.widget():
+            self.set_window_labels_visible(previous, False)
+
+        self.set_window_labels_visible(window, label_visible)
+        self._labels_visible_window = window
+
+    def set_window_labels_visible(self, window, boolean):
+        """Show/hide the filename labels of a subwindow (labels without a filename stay hidden).
+
+        Args:
+            window (QMdiSubWindow): The subwindow.
+            boolean (bool): True to show labels; False to hide.
+        """
+        child = window.widget()
+        with QtCore.QSignalBlocker(child):
+            child.label_main_topleft.set_visible_based_on_text(boolean)
+            child.label_topright.set_visible_based_on_text(boolean)
+            child.label_bottomright.set_visible_based_on_text(boolean)
+            child.label_bottomleft.set_visible_based_on_text(boolean)
 
     def set_window_close_pushbuttons_always_visible(self, window, boolean):
         """Enable/disable the always-on visiblilty of the close X on each subwindow.
@@ -768,10 +896,9 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
         changed_window = window
         always_visible = boolean
         changed_window.widget().set_close_pushbutton_always_visible(always_visible)
-        windows = self._mdiArea.subWindowList()
-        for window in windows:
-            if window != changed_window:
-                window.widget().set_close_pushbutton_always_visible(always_visible)
+        for child in self._child_widgets:
+            if child is not changed_window.widget():
+                child.set_close_pushbutton_always_visible(always_visible)
 
     def set_window_mouse_rect_visible(self, window, boolean):
         """Enable/disable the visiblilty of the red 1x1 outline at the pointer
@@ -787,18 +914,76 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
         changed_window = window
         visible = boolean
         changed_window.widget().set_mouse_rect_visible(visible)
-        windows = self._mdiArea.subWindowList()
-        for window in windows:
-            if window != changed_window:
-                window.widget().set_mouse_rect_visible(visible)
+        for child in self._child_widgets:
+            if child is not changed_window.widget():
+                child.set_mouse_rect_visible(visible)
 
     def auto_tile_subwindows_on_close(self):
         """Tile the subwindows of MDIArea using previously used tile method."""
         if self.subwindow_was_just_closed:
             self.subwindow_was_just_closed = False
-            QtCore.QTimer.singleShot(50, self._mdiArea.tile_what_was_done_last_time)
+            QtCore.QTimer.singleShot(50, QtCore.Qt.CoarseTimer, self._mdiArea.tile_what_was_done_last_time)
             self.refreshPanDelayed(50)
 
+    def _on_subwindow_activated(self, window):
+        """Dispatch all updates of a subwindow activation: the status bar now; the rest deferred to the next event-loop tick.
+
+        Repeated activations before the deferred update runs are collapsed into one update on the latest subwindow.
+        
+        Args:
+            window (QMdiSubWindow): The activated subwindow (None if no subwindow is active).
+        """
+        self._active_subwindow = window
+        self._activeChild = window.widget() if window is not None else None
+        self._active_view = self._activeChild._view_main_topleft if self._activeChild is not None else None
+        self.subWindowActivated(window)
+        self._pending_active = window
+        if self._active_hold_depth > 0:
+            self._active_update_held = True
+        else:
+            self._activation_timer.start()
+
+    @contextmanager
+    def hold_active_updates(self):
+        """Context manager which defers the update of a subwindow activation until the outermost hold exits (reentrant).
+
+        For bulk operations (for example, loading many images) so that the update runs once on the final active subwindow.
+        """
+        self._active_hold_depth += 1
+        try:
+            yield
+        finally:
+            self._active_hold_depth -= 1
+            if self._active_hold_depth == 0 and self._active_update_held:
+                self._active_update_held = False
+                self._activation_timer.start()
+
+    def _on_activation_timer_timeout(self):
+        """Run the deferred update for the latest activated subwindow."""
+        window = self._pending_active
+        self._pending_active = None
+        if window is not None and sip.isdeleted(window): # The subwindow may have been closed before the deferred update ran
+            window = self._mdiArea.activeSubWindow()
+        self._on_active_subwindow_changed(window)
+
+    def _on_active_subwindow_changed(self, window):
+        """Update all state which depends on the active subwindow in one pass.
+
+        The sliders, highlight, labels, and split-lock button are skipped if the subwindow is the same as last time 
+        (for example, when the main window regains focus); menus and tiling are always updated.
+
+        Args:
+            window (QMdiSubWindow): The active subwindow (None if no subwindow is active).
+        """
+        if window is not self._last_active_window:
+            self._last_active_window = window
+            self.update_sliders(window)
+            self.update_window_highlight(window)
+            self.update_window_labels(window)
+            self.update_mdi_buttons(window)
+        self.updateMenus()
+        self.auto_tile_subwindows_on_close()
+
     def update_mdi_buttons(self, window):
         """Update the interface button 'Split Lock' based on the status of the split (locked/unlocked) in the given window.
         
@@ -809,9 +994,7 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
             self._splitview_manager.lock_split_pushbutton.setChecked(False)
             return
         
-        child = self.activeMdiChild
-
-        self._splitview_manager.lock_split_pushbutton.setChecked(child.split_locked)
+        self._splitview_manager.lock_split_pushbutton.setChecked(window.widget().split_locked)
 
 
     def set_single_window_transform_mode_smooth(self, window, boolean):
@@ -835,9 +1018,8 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
         """
         if self._mdiArea.activeSubWindow() is None:
             return
-        windows = self._mdiArea.subWindowList()
-        for window in windows:
-            window.widget().set_transform_mode_smooth(boolean)
+        for child in self._child_widgets:
+            child.set_transform_mode_smooth(boolean)
 
     def set_all_background_color(self, color):
         """Set the background color of all subwindows. 
@@ -847,18 +1029,16 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
         """
         if self._mdiArea.activeSubWindow() is None:
             return
-        windows = self._mdiArea.subWindowList()
-        for window in windows:
-            window.widget().set_scene_background_color(color)
+        for child in self._child_widgets:
+            child.set_scene_background_color(color)
         self.scene_background_color = color
 
     def set_all_sync_zoom_by(self, by: str):
         """[str] Set the method by which to sync zoom all windows."""
         if self._mdiArea.activeSubWindow() is None:
             return
-        windows = self._mdiArea.subWindowList()
-        for window in windows:
-            window.widget().update_sync_zoom_by(by)
+        for child in self._child_widgets:
+            child.update_sync_zoom_by(by)
         self.sync_zoom_by = by
         self.refreshZoom()
 
@@ -869,21 +1049,16 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
     
     def show_about(self):
         """Show about box."""
-        sp = "<br>"
-        title = "Butterfly Viewer"
-        text = "Butterfly Viewer"
-        text = text + sp + "Lars Maxfield"
-        text = text + sp + "Version: " + VERSION
-        text = text + sp + "License: <a href='https://www.gnu.org/licenses/gpl-3.0.en.html'>GNU GPL v3</a> or later"
-        text = text + sp + "Source: <a href='https://github.com/olive-groves/butterfly_viewer'>github.com/olive-groves/butterfly_viewer</a>"
-        text = text + sp + "Tutorial: <a href='https://olive-groves.github.io/butterfly_viewer'>olive-groves.github.io/butterfly_viewer</a>"
-        box = QtWidgets.QMessageBox.about(self, title, text)
+        QtWidgets.QMessageBox.about(self, APPNAME, self._ABOUT_HTML)
 
     # View loading methods
 
     def loadFile(self, filename_main_topleft, filename_topright=None, filename_bottomleft=None, filename_bottomright=None):
         """Load an individual image or sliding overlay into new subwindow.
 
+        Images not yet decoded are decoded (and turned upright by EXIF) on QThreadPool workers (with the grayout shown if they total at least LOAD_GRAYOUT_MIN_BYTES);
+        the subwindow is created once all its images are ready. Subwindows are created in the order loadFile was called.
+
         Args:
             filename_main_topleft (str): The image filepath of the main image to be viewed; the basis of the sliding overlay (main; topleft)
             filename_topright (str): The image filepath for top-right of the sliding overlay (set None to exclude)
@@ -891,46 +1066,98 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
             filename_bottomright (str): The image filepath for bottom-right of the sliding overlay (set None to exclude)
         """
         
-        self.display_loading_grayout(True, "Loading viewer with main image '" + filename_main_topleft.split("/")[-1] + "'...")
+        filenames = (filename_main_topleft, filename_topright, filename_bottomleft, filename_bottomright)
+        decoding = {path for path in filenames if not self._is_pixmap_ready(path)}
+        is_grayout_shown = self._get_files_size(decoding) >= LOAD_GRAYOUT_MIN_BYTES
+
+        for path in decoding - self._paths_decoding: # One worker per file even if requested by several loads
+            QtCore.QThreadPool.globalInstance().start(ImageDecodeRunnable(path, self._image_decode_notifier))
+        self._paths_decoding |= decoding
+        self._pending_loads.append((filenames, decoding, is_grayout_shown))
+        if is_grayout_shown:
+            self.update_loading_grayout_of_pending_loads()
+        self._show_ready_loads()
+
+    def _get_files_size(self, paths):
+        """Get the total size of files, ignoring those which cannot be accessed.
+
+        Args:
+            paths (iterable of str): The filepaths.
+
+        Returns:
+            size (int): The total size in bytes.
+        """
+        size = 0
+        for path in paths:
+            try:
+                size += os.path.getsize(path)
+            except (OSError, TypeError):
+                pass
+        return size
+
+    def on_image_decoded(self, path, image):
+        """Convert a background-decoded image to QPixmap and create the subwindows whose images are now all ready.
+
+        Args:
+            path (str): The image filepath.
+            image (QImage): The decoded image (null if unreadable; the load then reports the error).
+        """
+        self._paths_decoding.discard(path)
+        key = self._pixmap_cache_key(path)
+        if key is not None:
+            pixmap = QtGui.QPixmap.fromImage(image) # QPixmap must be made on the GUI thread; wraps the decoded data without decoding again
+            self._decoded_pixmaps[key] = pixmap # Null pixmaps of unreadable files are kept too so they are not decoded again on the GUI thread
+            if not pixmap.isNull():
+                QtGui.QPixmapCache.insert(key, pixmap)
+        for _, decoding, _ in self._pending_loads:
+            decoding.discard(path)
+        self._show_ready_loads()
+
+    def _show_ready_loads(self):
+        """Create subwindows of pending loads in order, stopping at the first load still being decoded."""
+        was_grayout_shown = False
+        with self.batched_loads():
+            while self._pending_loads and not self._pending_loads[0][1]:
+                filenames, _, is_grayout_shown = self._pending_loads.pop(0)
+                was_grayout_shown |= is_grayout_shown
+                self._show_loaded_file(*filenames)
+        if was_grayout_shown:
+            self.update_loading_grayout_of_pending_loads()
+        if not self._pending_loads:
+            self._decoded_pixmaps.clear() # Held only until used (they may be too big for QPixmapCache)
+
+    def update_loading_grayout_of_pending_loads(self):
+        """Show the loading grayout for the first pending load which needs it; hide the grayout if no pending load needs it.
+
+        The grayout is shared by all loads, so it stays shown until the last load which showed it has its subwindow.
+        """
+        for filenames, _, is_grayout_shown in self._pending_loads:
+            if is_grayout_shown:
+                self.display_loading_grayout(True, "Loading viewer with main image '" + os.path.basename(filenames[0]) + "'...")
+                return
+        if self._loading_grayout_label is not None and not self._loading_grayout_label.isHidden():
+            self.display_loading_grayout(False)
 
+    def _show_loaded_file(self, filename_main_topleft, filename_topright, filename_bottomleft, filename_bottomright):
+        """Create the subwindow of a loaded individual image or sliding overlay (see loadFile for args)."""
         activeMdiChild = self.activeMdiChild
-        QtWidgets.QApplication.setOverrideCursor(QtCore.Qt.WaitCursor)
 
         transform_mode_smooth = self.is_global_transform_mode_smooth
         
-        pixmap = QtGui.QPixmap(filename_main_topleft)
-        pixmap_topright = QtGui.QPixmap(filename_topright)
-        pixmap_bottomleft = QtGui.QPixmap(filename_bottomleft)
-        pixmap_bottomright = QtGui.QPixmap(filename_bottomright)
-        
-        QtWidgets.QApplication.restoreOverrideCursor()
+        pixmap = self._load_pixmap_cached(filename_main_topleft)
+        pixmap_topright = self._load_pixmap_cached(filename_topright)
+        pixmap_bottomleft = self._load_pixmap_cached(filename_bottomleft)
+        pixmap_bottomright = self._load_pixmap_cached(filename_bottomright)
         
-        if (not pixmap or
-            pixmap.width()==0 or pixmap.height==0):
+        if pixmap.isNull():
             self.display_loading_grayout(True, "Waiting on dialog box...")
             QtWidgets.QMessageBox.warning(self, APPNAME,
                                       "Cannot read file %s." % (filename_main_topleft,))
             self.updateRecentFileSettings(filename_main_topleft, delete=True)
             self.updateRecentFileActions()
-            self.display_loading_grayout(False)
+            self.update_loading_grayout_of_pending_loads() # Other pending loads may still need the grayout
             return
         
-        angle = get_exif_rotation_angle(filename_main_topleft)
-        if angle:
-            pixmap = pixmap.transformed(QtGui.QTransform().rotate(angle))
-        
-        angle = get_exif_rotation_angle(filename_topright)
-        if angle:
-            pixmap_topright = pixmap_topright.transformed(QtGui.QTransform().rotate(angle))
-
-        angle = get_exif_rotation_angle(filename_bottomright)
-        if angle:
-            pixmap_bottomright = pixmap_bottomright.transformed(QtGui.QTransform().rotate(angle))
-
-        angle = get_exif_rotation_angle(filename_bottomleft)
-        if angle:
-            pixmap_bottomleft = pixmap_bottomleft.transformed(QtGui.QTransform().rotate(angle))
-
         child = self.createMdiChild(pixmap, filename_main_topleft, pixmap_topright, pixmap_bottomleft, pixmap_bottomright, transform_mode_smooth)
 
         # Show filenames
@@ -938,7 +1165,8 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
         child.label_topright.setText(filename_topright)
         child.label_bottomright.setText(filename_bottomright)
         child.label_bottomleft.setText(filename_bottomleft)
-        
+        self.set_window_labels_visible(child.parent(), False) # Shown once activated (see update_window_labels), as setText shows them
+
         child.show()
 
         if activeMdiChild:
@@ -946,10 +1174,9 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
                 self.synchPan(activeMdiChild)
             if self._synchZoomAct.isChecked():
                 self.synchZoom(activeMdiChild)
-                
-        self._mdiArea.tile_what_was_done_last_time()
 
         child.set_close_pushbutton_always_visible(self.is_interface_showing)
+        child.set_mouse_rect_visible(self.is_interface_showing) # Loads finish asynchronously, possibly after the interface was hidden
         if self.scene_background_color is not None:
             child.set_scene_background_color(self.scene_background_color)
 
@@ -957,18 +1184,89 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
         self.updateRecentFileActions()
         
         self._last_accessed_fullpath = filename_main_topleft
-
-        self.display_loading_grayout(False)
         
         sync_by = self.sync_zoom_by
         child.update_sync_zoom_by(sync_by)
 
-        child.fitToWindow()
+        self._pending_tile_children.append(child) # Tiled and fitted together with other new subwindows (see _flush_relayout)
+        self._schedule_relayout()
 
         self.statusBar().showMessage("File loaded", 2000)
 
+    @contextmanager
+    def batched_loads(self):
+        """Context manager which holds the relayout and activation update of new subwindows until the outermost batch exits (reentrant)."""
+        self._load_batch_depth += 1
+        try:
+            with self.hold_active_updates(): # Each new subwindow is activated in turn; update only for the last
+                yield
+        finally:
+            self._load_batch_depth -= 1
+            if self._load_batch_depth == 0 and self._pending_tile_children:
+                self._schedule_relayout()
+
+    def _schedule_relayout(self):
+        """Tile and fit new subwindows on the next event-loop tick, once for all subwindows created until then."""
+        if self._relayout_queued or self._load_batch_depth > 0:
+            return
+        self._relayout_queued = True
+        QtCore.QTimer.singleShot(0, QtCore.Qt.CoarseTimer, self._flush_relayout)
+
+    def _flush_relayout(self):
+        """Tile the subwindows once using the previous tile method and fit each new subwindow."""
+        self._relayout_queued = False
+        if self._load_batch_depth > 0: # Batch still open; its exit reschedules
+            return
+        children = self._pending_tile_children
+        self._pending_tile_children = []
+        self._mdiArea.tile_what_was_done_last_time()
+        for child in children:
+            if not sip.isdeleted(child):
+                child.fitToWindow()
+
+    def _pixmap_cache_key(self, path):
+        """str or None: Key of an image file in QPixmapCache (None if absent); mtime included so edited files are decoded anew."""
+        try:
+            return f"{path}:{os.stat(path).st_mtime_ns}"
+        except (OSError, TypeError):
+            return None
+
+    def _is_pixmap_ready(self, path):
+        """bool: True if the image file needs no decoding (already decoded and unmodified, or no file given)."""
+        key = self._pixmap_cache_key(path)
+        return key is None or key in self._decoded_pixmaps or QtGui.QPixmapCache.find(key) is not None
+
+    def _load_pixmap_cached(self, path):
+        """Load an image file as upright QPixmap, reusing the decoded pixmap if the same unmodified file was loaded before.
+
+        Args:
+            path (str): The image filepath (None gives a null pixmap).
+
+        Returns:
+            pixmap (QPixmap): The decoded image; null if the file is absent or unreadable.
+        """
+        key = self._pixmap_cache_key(path)
+        if key is None:
+            return QtGui.QPixmap()
+        if key in self._decoded_pixmaps: # Decoded in background (may be too big to cache or null)
+            return self._decoded_pixmaps[key]
+        pixmap = QtGui.QPixmapCache.find(key)
+        if pixmap is None: # Decoding on the GUI thread only as fallback (for example, file modified since its background decode)
+            pixmap = QtGui.QPixmap.fromImage(read_oriented_image(path))
+            if not pixmap.isNull():
+                QtGui.QPixmapCache.insert(key, pixmap)
+        return pixmap
+
+    def clear_pixmap_cache(self):
+        """Clear the cache of decoded images (and shared interface icons, which are rendered again as needed)."""
+        QtGui.QPixmapCache.clear()
+        self.statusBar().showMessage("Image cache cleared", 2000)
+
     def load_from_dragged_and_dropped_file(self, filename_main_topleft):
-        """Load an individual image (convenience function — e.g., from a single emitted single filename)."""
+        """Load an individual image (convenience function — e.g., from a single emitted single filename).
+
+        Multiple dropped files decode in parallel (see loadFile) and their subwindows are created in the order dropped.
+        """
         self.loadFile(filename_main_topleft)
     
     def createMdiChild(self, pixmap, filename_main_topleft, pixmap_topright, pixmap_bottomleft, pixmap_bottomright, transform_mode_smooth):
@@ -998,8 +1296,8 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
         
         self._mdiArea.addSubWindow(child, QtCore.Qt.FramelessWindowHint) # LVM: No frame, starts fitted
 
-        child.scrollChanged.connect(self.panChanged)
-        child.transformChanged.connect(self.zoomChanged)
+        child.was_changed_pan.connect(self.panChanged)
+        child.was_changed_zoom.connect(self.zoomChanged)
         
         child.positionChanged.connect(self.on_positionChanged)
         child.tracker.mouse_leaved.connect(self.on_mouse_leaved)
@@ -1013,6 +1311,10 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
         child.was_set_global_transform_mode.connect(self.set_all_window_transform_mode_smooth)
         child.was_set_scene_background_color.connect(self.set_all_background_color)
         child.was_set_sync_zoom_by.connect(self.set_all_sync_zoom_by)
+        child.was_changed_sync_this.connect(self.invalidateSyncReceivers)
+
+        self._child_widgets.append(child)
+        self.invalidateSyncReceivers()
 
         return child
 
@@ -1033,25 +1335,34 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
 
     def fit_to_window(self):
         """Fit the view of the active subwindow (if it exists)."""
-        if self.activeMdiChild:
-            self.activeMdiChild.fitToWindow()
+        child = self.activeMdiChild
+        if child:
+            child.fitToWindow()
 
     def update_split(self):
         """Update the position of the split of the active subwindow (if it exists) relying on the global mouse coordinates."""
-        if self.activeMdiChild:
-            self.activeMdiChild.update_split() # No input = Rely on global mouse position calculation
+        child = self.activeMdiChild
+        if child:
+            child.update_split() # No input = Rely on global mouse position calculation
+
+    def _schedule_split_update(self):
+        """Update the split on the next frame unless already scheduled (split follows the global mouse position at that time)."""
+        if not self._split_update_timer.isActive():
+            self._split_update_timer.start()
 
     def lock_split(self):
         """Lock the position of the overlay split of active subwindow and set relevant interface elements."""
-        if self.activeMdiChild:
-            self.activeMdiChild.split_locked = True
+        child = self.activeMdiChild
+        if child:
+            child.split_locked = True
         self._splitview_manager.lock_split_pushbutton.setChecked(True)
         self.update_window_highlight(self._mdiArea.activeSubWindow())
 
     def unlock_split(self):
         """Unlock the position of the overlay split of active subwindow and set relevant interface elements."""
-        if self.activeMdiChild:
-            self.activeMdiChild.split_locked = False
+        child = self.activeMdiChild
+        if child:
+            child.split_locked = False
         self._splitview_manager.lock_split_pushbutton.setChecked(False)
         self.update_window_highlight(self._mdiArea.activeSubWindow())
 
@@ -1065,12 +1376,15 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
             ignore_lock (bool): True to ignore the lock status of the split; False to adhere.
             percent_of_visible (bool): True to set split as proportion of visible area; False as proportion of the full image resolution.
         """
-        if self.activeMdiChild:
-            self.activeMdiChild.set_split(x_percent, y_percent, ignore_lock=ignore_lock, percent_of_visible=percent_of_visible)
         if apply_to_all:
-            windows = self._mdiArea.subWindowList()
-            for window in windows:
-                window.widget().set_split(x_percent, y_percent, ignore_lock=ignore_lock, percent_of_visible=percent_of_visible)
+            for child in self._child_widgets:
+                with QtCore.QSignalBlocker(child): # Scroll changes echoed back would refresh the splits of all subwindows per subwindow
+                    child.set_split(x_percent, y_percent, ignore_lock=ignore_lock, percent_of_visible=percent_of_visible)
+            self.on_scrollChanged()
+        else:
+            child = self.activeMdiChild
+            if child:
+                child.set_split(x_percent, y_percent, ignore_lock=ignore_lock, percent_of_visible=percent_of_visible)
         self.update_window_highlight(self._mdiArea.activeSubWindow())
 
     def set_split_from_slider(self):
@@ -1103,46 +1417,62 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
     @QtCore.pyqtSlot()
     def on_scrollChanged(self):
         """Refresh position of split of all subwindows based on their respective last position."""
-        windows = self._mdiArea.subWindowList()
-        for window in windows:
-            window.widget().refresh_split_based_on_last_updated_point_of_split_on_scene_main()
+        for child in self._child_widgets:
+            child.refresh_split_based_on_last_updated_point_of_split_on_scene_main()
 
     def on_subwindow_closed(self):
-        """Record that a subwindow was closed upon the closing of a subwindow."""
+        """Record that a subwindow was closed upon the closing of a subwindow and forget its child widget."""
         self.subwindow_was_just_closed = True
+        child = self.sender()
+        if child in self._child_widgets:
+            self._child_widgets.remove(child)
+            self.invalidateSyncReceivers()
+        if self._labels_visible_window is not None and child is self._labels_visible_window.widget(): # No stale reference to the closing subwindow
+            self._labels_visible_window = None
+        if self._last_highlighted_window is not None and child is self._last_highlighted_window.widget():
+            self._last_highlighted_window = None
+        if self._last_active_window is not None and child is self._last_active_window.widget():
+            self._last_active_window = None
+        if child is self._activeChild: # Until the next activation
+            self._activeChild = None
+            self._active_view = None
     
     @QtCore.pyqtSlot()
     def on_mouse_leaved(self):
         """Update displayed coordinates of mouse as N/A upon the mouse leaving the subwindow area."""
-        self._label_mouse.setText("View pixel coordinates: ( N/A , N/A )")
-        self._label_mouse.adjustSize()
+        self._last_shown_xy = None
+        self.set_label_mouse_text("View pixel coordinates: ( N/A , N/A )")
         
     @QtCore.pyqtSlot(QtCore.QPoint)
     def on_positionChanged(self, pos):
-        """Update displayed coordinates of mouse on the active subwindow using global coordinates."""
-    
-        point_of_mouse_on_viewport = QtCore.QPointF(pos.x(), pos.y())
-        pos_qcursor_global = QtGui.QCursor.pos()
+        """Update displayed coordinates of mouse on the active subwindow.
         
-        if self.activeMdiChild:
-        
-            # Use mouse position to grab scene coordinates (activeMdiChild?)
-            active_view = self.activeMdiChild._view_main_topleft
-            point_of_mouse_on_scene = active_view.mapToScene(point_of_mouse_on_viewport.x(), point_of_mouse_on_viewport.y())
-
+        Called on every mouse move, so the text is only rebuilt when the integer coordinates change.
+        """
+        active_view = self._active_view
+        if active_view is not None:
+            point_of_mouse_on_scene = active_view.mapToScene(pos)
+            xy = (int(point_of_mouse_on_scene.x()), int(point_of_mouse_on_scene.y()))
             if not self._label_mouse.isVisible():
                 self._label_mouse.show()
-            self._label_mouse.setText("View pixel coordinates: ( x = %d , y = %d )" % (point_of_mouse_on_scene.x(), point_of_mouse_on_scene.y()))
-            
-            pos_qcursor_view = active_view.mapFromGlobal(pos_qcursor_global)
-            pos_qcursor_scene = active_view.mapToScene(pos_qcursor_view)
-            # print("Cursor coords scene: ( %d , %d )" % (pos_qcursor_scene.x(), pos_qcursor_scene.y()))
-            
+            if xy == self._last_shown_xy:
+                return
+            self._last_shown_xy = xy
+            self.set_label_mouse_text(f"View pixel coordinates: ( x = {xy[0]} , y = {xy[1]} )")
         else:
-            
-            self._label_mouse.setText("View pixel coordinates: ( N/A , N/A )")
-            
-        self._label_mouse.adjustSize()
+            self._last_shown_xy = None
+            self.set_label_mouse_text("View pixel coordinates: ( N/A , N/A )")
+
+    def set_label_mouse_text(self, text):
+        """Set the text of the label of mouse coordinates, resizing the label only if the length of the text changed.
+        
+        Args:
+            text (str): The text to show.
+        """
+        self._label_mouse.setText(text)
+        if len(text) != self._last_label_len:
+            self._last_label_len = len(text)
+            self._label_mouse.adjustSize()
 
     
     # Transparency methods
@@ -1153,64 +1483,82 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
         """Set transparency of base of sliding overlay of active subwindow.
         
         Triggered upon change in interface transparency slider.
-        Temporarily sets position of split to the center of the visible area to give user a preview of the transparency effect.
+        Applied on the next frame with the latest value (see apply_pending_opacities).
 
         Args:
             value (float,int): The transparency as percent opacity, where 100 is opaque (not transparent) and 0 is transparent (0-100).
         """
-        if not self.activeMdiChild:
-            return
-        if not self.activeMdiChild.split_locked:
-            self.set_split_from_slider()
-        self.activeMdiChild.set_opacity_base(value)
+        self.schedule_opacity("base", value)
 
     @QtCore.pyqtSlot(int)
     def on_slider_opacity_topright_changed(self, value):
         """Set transparency of top-right of sliding overlay of active subwindow.
         
         Triggered upon change in interface transparency slider.
-        Temporarily sets position of split to the center of the visible area to give user a preview of the transparency effect.
+        Applied on the next frame with the latest value (see apply_pending_opacities).
 
         Args:
             value (float,int): The transparency as percent opacity, where 100 is opaque (not transparent) and 0 is transparent (0-100).
         """
-        if not self.activeMdiChild:
-            return
-        if not self.activeMdiChild.split_locked:
-            self.set_split_from_slider()
-        self.activeMdiChild.set_opacity_topright(value)
+        self.schedule_opacity("topright", value)
 
     @QtCore.pyqtSlot(int)
     def on_slider_opacity_bottomright_changed(self, value):
         """Set transparency of bottom-right of sliding overlay of active subwindow.
         
         Triggered upon change in interface transparency slider.
-        Temporarily sets position of split to the center of the visible area to give user a preview of the transparency effect.
+        Applied on the next frame with the latest value (see apply_pending_opacities).
 
         Args:
             value (float,int): The transparency as percent opacity, where 100 is opaque (not transparent) and 0 is transparent (0-100).
         """
-        if not self.activeMdiChild:
-            return
-        if not self.activeMdiChild.split_locked:
-            self.set_split_from_slider()    
-        self.activeMdiChild.set_opacity_bottomright(value)
+        self.schedule_opacity("bottomright", value)
 
     @QtCore.pyqtSlot(int)
     def on_slider_opacity_bottomleft_changed(self, value):
         """Set transparency of bottom-left of sliding overlay of active subwindow.
         
         Triggered upon change in interface transparency slider.
-        Temporarily sets position of split to the center of the visible area to give user a preview of the transparency effect.
+        Applied on the next frame with the latest value (see apply_pending_opacities).
 
         Args:
             value (float,int): The transparency as percent opacity, where 100 is opaque (not transparent) and 0 is transparent (0-100).
         """
-        if not self.activeMdiChild:
+        self.schedule_opacity("bottomleft", value)
+
+    def schedule_opacity(self, quadrant, value):
+        """Queue the transparency of a quadrant of the active subwindow, applying queued values at most once per frame.
+
+        Args:
+            quadrant (str): The quadrant of the sliding overlay ("base", "topright", "bottomright", or "bottomleft").
+            value (float,int): The transparency as percent opacity (0-100).
+        """
+        child = self.activeMdiChild
+        if not child:
+            return
+        if child is not self._opacity_child: # Values queued for another subwindow go to that subwindow
+            self.apply_pending_opacities()
+        self._opacity_child = child
+        self._pending_opacities[quadrant] = value
+        if not self._opacity_timer.isActive():
+            self._opacity_timer.start()
+
+    def apply_pending_opacities(self):
+        """Set the latest queued transparencies of the subwindow they were queued for.
+        
+        Temporarily sets position of split to the center of the visible area to give user a preview of the transparency effect.
+        """
+        self._opacity_timer.stop()
+        pending = self._pending_opacities
+        child = self._opacity_child
+        self._pending_opacities = {}
+        self._opacity_child = None
+        if child is None or sip.isdeleted(child):
             return
-        if not self.activeMdiChild.split_locked:
+        if child is self.activeMdiChild and not child.split_locked:
             self.set_split_from_slider()
-        self.activeMdiChild.set_opacity_bottomleft(value)
+        for quadrant, value in pending.items():
+            getattr(child, "set_opacity_" + quadrant)(value)
 
     def update_sliders(self, window):
         """Update interface transparency sliders upon subwindow activating using the subwindow transparency values.
@@ -1218,20 +1566,15 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
         Args:
             window (QMdiSubWindow): The active subwindow.
         """
-        if window is None:
-            self._sliders_opacity_splitviews.reset_sliders()
-            return
-
-        child = self.activeMdiChild
-        
-        self._sliders_opacity_splitviews.set_enabled(True, child.pixmap_topright_exists, child.pixmap_bottomright_exists, child.pixmap_bottomleft_exists)
-
-        opacity_base_of_activeMdiChild = child._opacity_base
-        opacity_topright_of_activeMdiChild = child._opacity_topright
-        opacity_bottomright_of_activeMdiChild = child._opacity_bottomright
-        opacity_bottomleft_of_activeMdiChild = child._opacity_bottomleft
+        sliders = self._sliders_opacity_splitviews
+        with QtCore.QSignalBlocker(sliders): # Only syncing the interface; not to echo the values back to the subwindow (nor reset its split)
+            if window is None:
+                sliders.reset_sliders()
+                return
 
-        self._sliders_opacity_splitviews.update_sliders(opacity_base_of_activeMdiChild, opacity_topright_of_activeMdiChild, opacity_bottomright_of_activeMdiChild, opacity_bottomleft_of_activeMdiChild)
+            child = window.widget()
+            sliders.set_enabled(True, child.pixmap_topright_exists, child.pixmap_bottomright_exists, child.pixmap_bottomleft_exists)
+            sliders.update_sliders(child._opacity_base, child._opacity_topright, child._opacity_bottomright, child._opacity_bottomleft)
 
 
     # [Legacy methods from derived MDI Image Viewer]
@@ -1272,11 +1615,10 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
             "Switch &layout direction", self,
             triggered=self.switchLayoutDirection)
 
-        #create dummy recent file actions
-        for i in range(MultiViewMainWindow.MaxRecentFiles):
-            self._recentFileActions.append(
-                QtWidgets.QAction(self, visible=False,
-                              triggered=self._recentFileMapper.map))
+        self._clearPixmapCacheAct = QtWidgets.QAction(
+            "&Clear image cache", self,
+            statusTip="Free the memory of recently opened images (they are decoded again when reopened)",
+            triggered=self.clear_pixmap_cache)
 
         self._exitAct = QtWidgets.QAction(
             "E&xit", self,
@@ -1309,7 +1651,72 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
             statusTip="Synch panning of subwindows",
             triggered=self.toggleSynchPan)
 
-        #Scroll menu actions
+        #Scroll and zoom menu actions are built on first show of their menus (see _ensureScrollActions and _ensureZoomActions)
+        self._scrollActions = None
+        self._zoomActions = None
+
+        #Window menu actions
+        self._activateSubWindowSystemMenuAct = QtWidgets.QAction(
+            "Activate &System Menu", self,
+            shortcut=self._SHORTCUT_SYSTEM_MENU,
+            statusTip="Activate subwindow System Menu",
+            triggered=self.activateSubwindowSystemMenu)
+
+        self._closeAct = QtWidgets.QAction(
+            "Cl&ose", self,
+            shortcut=QtGui.QKeySequence.Close,
+            shortcutContext=QtCore.Qt.WidgetShortcut,
+            #shortcut="Ctrl+Alt+F4",
+            statusTip="Close the active window",
+            triggered=self._mdiArea.closeActiveSubWindow)
+
+        self._closeAllAct = QtWidgets.QAction(
+            "Close &All", self,
+            statusTip="Close all the windows",
+            triggered=self._mdiArea.closeAllSubWindows)
+
+        self._tileAct = QtWidgets.QAction(
+            "&Tile", self,
+            statusTip="Tile the windows",
+            triggered=self._mdiArea.tileSubWindows)
+
+        self._tileAct.triggered.connect(self.tile_and_fit_mdiArea)
+
+        self._cascadeAct = QtWidgets.QAction(
+            "&Cascade", self,
+            statusTip="Cascade the windows",
+            triggered=self._mdiArea.cascadeSubWindows)
+
+        self._nextAct = QtWidgets.QAction(
+            "Ne&xt", self,
+            shortcut=QtGui.QKeySequence.NextChild,
+            statusTip="Move the focus to the next window",
+            triggered=self._mdiArea.activateNextSubWindow)
+
+        self._previousAct = QtWidgets.QAction(
+            "Pre&vious", self,
+            shortcut=QtGui.QKeySequence.PreviousChild,
+            statusTip="Move the focus to the previous window",
+            triggered=self._mdiArea.activatePreviousSubWindow)
+
+        self._separatorAct = QtWidgets.QAction(self)
+        self._separatorAct.setSeparator(True)
+
+        self._aboutAct = QtWidgets.QAction(
+            "&About", self,
+            statusTip="Show the application's About box",
+            triggered=self.about)
+
+        self._aboutQtAct = QtWidgets.QAction(
+            "About &Qt", self,
+            statusTip="Show the Qt library's About box",
+            triggered=QtWidgets.QApplication.aboutQt)
+
+    def _ensureScrollActions(self):
+        """Create the Scroll menu actions and add them to the menu, only once (on first show of the menu)."""
+        if self._scrollActions is not None:
+            return
+
         self._scrollActions = [
             self.createMappedAction(
                 None,
@@ -1338,11 +1745,16 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
             self.createMappedAction(
                 None,
                 "&Center", self,
-                "5",
+                self._SHORTCUT_CENTER,
                 "centerView"),
             ]
+        self._scrollMenu.addActions(self._scrollActions)
+
+    def _ensureZoomActions(self):
+        """Create the Zoom menu actions and add them to the menu, only once (on first show of the menu)."""
+        if self._zoomActions is not None:
+            return
 
-        #zoom menu actions
         separatorAct = QtWidgets.QAction(self)
         separatorAct.setSeparator(True)
 
@@ -1370,84 +1782,28 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
             self.createMappedAction(
                 None,
                 "Actual &Size", self,
-                "/",
+                self._SHORTCUT_ACTUAL_SIZE,
                 "actualSize"),
 
             self.createMappedAction(
                 None,
                 "Fit &Image", self,
-                "*",
+                self._SHORTCUT_FIT_IMAGE,
                 "fitToWindow"),
 
             self.createMappedAction(
                 None,
                 "Fit &Width", self,
-                "Alt+Right",
+                self._SHORTCUT_FIT_WIDTH,
                 "fitWidth"),
 
             self.createMappedAction(
                 None,
                 "Fit &Height", self,
-                "Alt+Down",
+                self._SHORTCUT_FIT_HEIGHT,
                 "fitHeight"),
            ]
-
-        #Window menu actions
-        self._activateSubWindowSystemMenuAct = QtWidgets.QAction(
-            "Activate &System Menu", self,
-            shortcut="Ctrl+ ",
-            statusTip="Activate subwindow System Menu",
-            triggered=self.activateSubwindowSystemMenu)
-
-        self._closeAct = QtWidgets.QAction(
-            "Cl&ose", self,
-            shortcut=QtGui.QKeySequence.Close,
-            shortcutContext=QtCore.Qt.WidgetShortcut,
-            #shortcut="Ctrl+Alt+F4",
-            statusTip="Close the active window",
-            triggered=self._mdiArea.closeActiveSubWindow)
-
-        self._closeAllAct = QtWidgets.QAction(
-            "Close &All", self,
-            statusTip="Close all the windows",
-            triggered=self._mdiArea.closeAllSubWindows)
-
-        self._tileAct = QtWidgets.QAction(
-            "&Tile", self,
-            statusTip="Tile the windows",
-            triggered=self._mdiArea.tileSubWindows)
-
-        self._tileAct.triggered.connect(self.tile_and_fit_mdiArea)
-
-        self._cascadeAct = QtWidgets.QAction(
-            "&Cascade", self,
-            statusTip="Cascade the windows",
-            triggered=self._mdiArea.cascadeSubWindows)
-
-        self._nextAct = QtWidgets.QAction(
-            "Ne&xt", self,
-            shortcut=QtGui.QKeySequence.NextChild,
-            statusTip="Move the focus to the next window",
-            triggered=self._mdiArea.activateNextSubWindow)
-
-        self._previousAct = QtWidgets.QAction(
-            "Pre&vious", self,
-            shortcut=QtGui.QKeySequence.PreviousChild,
-            statusTip="Move the focus to the previous window",
-            triggered=self._mdiArea.activatePreviousSubWindow)
-
-        self._separatorAct = QtWidgets.QAction(self)
-        self._separatorAct.setSeparator(True)
-
-        self._aboutAct = QtWidgets.QAction(
-            "&About", self,
-            statusTip="Show the application's About box",
-            triggered=self.about)
-
-        self._aboutQtAct = QtWidgets.QAction(
-            "About &Qt", self,
-            statusTip="Show the Qt library's About box",
-            triggered=QtWidgets.QApplication.aboutQt)
+        self._zoomMenu.addActions(self._zoomActions)
 
     def createMenus(self):
         """Create menus."""
@@ -1456,11 +1812,10 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
         self._fileMenu.addAction(self._switchLayoutDirectionAct)
 
         self._fileSeparatorAct = self._fileMenu.addSeparator()
-        for action in self._recentFileActions:
-            self._fileMenu.addAction(action)
-        self.updateRecentFileActions()
-        self._fileMenu.addSeparator()
+        self._fileRecentEndAct = self._fileMenu.addSeparator() # Recent file actions are inserted before it (see updateRecentFileActions)
+        self._fileMenu.addAction(self._clearPixmapCacheAct)
         self._fileMenu.addAction(self._exitAct)
+        self.updateRecentFileActions()
 
         self._viewMenu = self.menuBar().addMenu("&View")
         self._viewMenu.addAction(self._showScrollbarsAct)
@@ -1470,12 +1825,21 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
         self._viewMenu.addAction(self._synchPanAct)
 
         self._scrollMenu = self.menuBar().addMenu("&Scroll")
-        [self._scrollMenu.addAction(action) for action in self._scrollActions]
+        self._scrollMenu.aboutToShow.connect(self._ensureScrollActions)
 
         self._zoomMenu = self.menuBar().addMenu("&Zoom")
-        [self._zoomMenu.addAction(action) for action in self._zoomActions]
+        self._zoomMenu.aboutToShow.connect(self._ensureZoomActions)
 
         self._windowMenu = self.menuBar().addMenu("&Window")
+        self._windowMenu.addAction(self._closeAct)
+        self._windowMenu.addAction(self._closeAllAct)
+        self._windowMenu.addSeparator()
+        self._windowMenu.addAction(self._tileAct)
+        self._windowMenu.addAction(self._cascadeAct)
+        self._windowMenu.addSeparator()
+        self._windowMenu.addAction(self._nextAct)
+        self._windowMenu.addAction(self._previousAct)
+        self._windowMenu.addAction(self._separatorAct)
         self.updateWindowMenu()
         self._windowMenu.aboutToShow.connect(self.updateWindowMenu)
 
@@ -1504,37 +1868,43 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
     def updateRecentFileActions(self):
         """Update recent file menu items."""
         settings = QtCore.QSettings()
-        files = settings.value(SETTING_RECENTFILELIST)
+        files = settings.value(SETTING_RECENTFILELIST, [], type=list) # As list even if a single file (INI stores it as a string)
         numRecentFiles = min(len(files) if files else 0,
                              MultiViewMainWindow.MaxRecentFiles)
 
+        while len(self._recentFileActions) < numRecentFiles: # Created only as needed
+            action = QtWidgets.QAction(self)
+            action.triggered.connect(lambda checked=False, action=action: self.openRecentFile(action.data())) # File is held as the data of the action
+            self._fileMenu.insertAction(self._fileRecentEndAct, action)
+            self._recentFileActions.append(action)
+
         for i in range(numRecentFiles):
             text = "&%d %s" % (i + 1, strippedName(files[i]))
             self._recentFileActions[i].setText(text)
             self._recentFileActions[i].setData(files[i])
             self._recentFileActions[i].setVisible(True)
-            self._recentFileMapper.setMapping(self._recentFileActions[i],
-                                              files[i])
 
-        for j in range(numRecentFiles, MultiViewMainWindow.MaxRecentFiles):
+        for j in range(numRecentFiles, len(self._recentFileActions)):
             self._recentFileActions[j].setVisible(False)
 
         self._fileSeparatorAct.setVisible((numRecentFiles > 0))
 
     def updateWindowMenu(self):
-        """Update the Window menu."""
-        self._windowMenu.clear()
-        self._windowMenu.addAction(self._closeAct)
-        self._windowMenu.addAction(self._closeAllAct)
-        self._windowMenu.addSeparator()
-        self._windowMenu.addAction(self._tileAct)
-        self._windowMenu.addAction(self._cascadeAct)
-        self._windowMenu.addSeparator()
-        self._windowMenu.addAction(self._nextAct)
-        self._windowMenu.addAction(self._previousAct)
-        self._windowMenu.addAction(self._separatorAct)
+        """Update the subwindow entries of the Window menu.
 
+        Entries are kept between updates: only those of new subwindows are created and those of closed subwindows removed;
+        the rest just have their text and check state updated.
+        """
         windows = self._mdiArea.subWindowList()
+        active_window = self._mdiArea.activeSubWindow()
+        cache = self._windowActionCache
+
+        open_windows = set(windows)
+        for window in [window for window in cache if window not in open_windows]:
+            action = cache.pop(window)
+            self._windowMenu.removeAction(action)
+            action.deleteLater()
+
         self._separatorAct.setVisible(len(windows) != 0)
 
         for i, window in enumerate(windows):
@@ -1544,11 +1914,15 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
             if i < 9:
                 text = '&' + text
 
-            action = self._windowMenu.addAction(text)
-            action.setCheckable(True)
-            action.setChecked(child == self.activeMdiChild)
-            action.triggered.connect(self._windowMapper.map)
-            self._windowMapper.setMapping(action, window)
+            action = cache.get(window)
+            if action is None: # Subwindows are listed in creation order, so new entries go at the end
+                action = self._windowMenu.addAction(text)
+                action.setCheckable(True)
+                action.triggered.connect(lambda checked=False, window=window: self.setActiveSubWindow(window))
+                cache[window] = action
+            elif action.text() != text:
+                action.setText(text)
+            action.setChecked(window is active_window)
 
     def createStatusBarLabel(self, stretch=0):
         """Create status bar label.
@@ -1561,9 +1935,10 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
         self.statusBar().addWidget(label, stretch)
         return label
 
-    def createStatusBar(self):
-        """Create status bar."""
-        statusBar = self.statusBar()
+    def _ensureStatusBar(self):
+        """Create the status bar labels, only once (on first show of the status bar)."""
+        if self._sbLabelName is not None:
+            return
 
         self._sbLabelName = self.createStatusBarLabel(1)
         self._sbLabelSize = self.createStatusBarLabel()
@@ -1571,17 +1946,28 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
         self._sbLabelDate = self.createStatusBarLabel()
         self._sbLabelZoom = self.createStatusBarLabel()
 
-        statusBar.showMessage("Ready")
+        self.statusBar().showMessage("Ready")
 
 
     @property
     def activeMdiChild(self):
-        """Get active MDI child (:class:`SplitViewMdiChild` or *None*)."""
-        activeSubWindow = self._mdiArea.activeSubWindow()
-        if activeSubWindow:
-            return activeSubWindow.widget()
-        return None
+        """Get active MDI child (:class:`SplitViewMdiChild` or *None*), as cached upon subwindow activation."""
+        return self._activeChild
+
+
+    def eventFilter(self, source, event):
+        """Override event filter to update the split while the mouse hovers over the buttons of the interface containers.
+
+        Args:
+            source (PyQt source)
+            event (PyQt event)
 
+        Returns:
+            The base eventFilter using source and event (passes it along to PyQt).
+        """
+        if event.type() in (QtCore.QEvent.HoverEnter, QtCore.QEvent.HoverMove, QtCore.QEvent.HoverLeave) and source.parentWidget() in self._hover_hosts:
+            self._schedule_split_update()
+        return super().eventFilter(source, event)
 
     def closeEvent(self, event):
         """Overrides close event to save application settings.
@@ -1590,7 +1976,7 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
 
         if self.is_fullscreen: # Needed to properly close the image viewer if the main window is closed while the viewer is fullscreen
             self.is_fullscreen = False
-            self.setCentralWidget(self.mdiarea_plus_buttons)
+            self.return_mdiarea_to_central_stack()
 
         self._mdiArea.closeAllSubWindows()
         if self.activeMdiChild:
@@ -1622,14 +2008,16 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
         if self._synchPanAct.isChecked():
             self.synchPan(self.activeMdiChild)
 
-    @QtCore.pyqtSlot()
-    def panChanged(self):
-        """Synchronize subwindow pans."""
-        mdiChild = self.sender()
-        while mdiChild is not None and type(mdiChild) != SplitViewMdiChild:
-            mdiChild = mdiChild.parent()
-        if mdiChild and self._synchPanAct.isChecked():
-            self.synchPan(mdiChild)
+    @QtCore.pyqtSlot(QtCore.QObject)
+    def panChanged(self, mdiChild):
+        """Synchronize subwindow pans (deferred; see _scheduleSync).
+
+        Args:
+            mdiChild (SplitViewMdiChild): The child whose pan changed.
+        """
+        if self._synchPanAct.isChecked():
+            self._syncPanFrom = mdiChild
+            self._scheduleSync()
 
     @QtCore.pyqtSlot()
     def toggleSynchZoom(self):
@@ -1637,13 +2025,39 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
         if self._synchZoomAct.isChecked():
             self.synchZoom(self.activeMdiChild)
 
-    @QtCore.pyqtSlot()
-    def zoomChanged(self):
-        """Synchronize subwindow zooms."""
-        mdiChild = self.sender()
+    @QtCore.pyqtSlot(QtCore.QObject)
+    def zoomChanged(self, mdiChild):
+        """Synchronize subwindow zooms (deferred; see _scheduleSync).
+
+        Args:
+            mdiChild (SplitViewMdiChild): The child whose zoom changed.
+        """
         if self._synchZoomAct.isChecked():
-            self.synchZoom(mdiChild)
-        self.updateStatusBar()
+            self._syncZoomFrom = mdiChild
+            self._scheduleSync()
+        if self._showStatusbarAct.isChecked() and not self._statusBarTimer.isActive():
+            self._statusBarTimer.start()
+
+    def _scheduleSync(self):
+        """Schedule the synch of pan and zoom on the next event-loop tick.
+        
+        A burst of scroll and transform changes (for example, during a mouse drag or wheel zoom) is synched once 
+        from the latest subwindow which changed; calls until then only update that subwindow.
+        """
+        if self._syncPending:
+            return
+        self._syncPending = True
+        QtCore.QTimer.singleShot(0, self._flushSync)
+
+    def _flushSync(self):
+        """Synch the zoom, then the pan, from the subwindows which last changed them."""
+        self._syncPending = False
+        zoomFrom, self._syncZoomFrom = self._syncZoomFrom, None
+        panFrom, self._syncPanFrom = self._syncPanFrom, None
+        if zoomFrom is not None and not sip.isdeleted(zoomFrom):
+            self.synchZoom(zoomFrom)
+        if panFrom is not None and not sip.isdeleted(panFrom):
+            self.synchPan(panFrom)
 
     def synchPan(self, fromViewer):
         """Synch panning of all subwindowws to the same as *fromViewer*.
@@ -1653,6 +2067,8 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
         assert isinstance(fromViewer, SplitViewMdiChild)
         if not fromViewer:
             return
+        if len(self._child_widgets) <= 1: # Nothing to synch with a single subwindow
+            return
         if self._handlingScrollChangedSignal:
             return
         if fromViewer.parent() != self._mdiArea.activeSubWindow(): # Prevent circular scroll state change signals from propagating
@@ -1661,13 +2077,16 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
         self._handlingScrollChangedSignal = True
 
         newState = fromViewer.scrollState
-        changedWindow = fromViewer.parent()
-        windows = self._mdiArea.subWindowList()
-        for window in windows:
-            if window != changedWindow:
-                if window.widget().sync_this_pan:
-                    window.widget().scrollState = newState
-                    window.widget().resize_scene()
+        if self._panReceivers is None:
+            self._panReceivers = [child for child in self._child_widgets if child.sync_this_pan]
+        receivers = [receiver for receiver in self._panReceivers if receiver is not fromViewer and receiver.scrollState != newState] # Unchanged receivers need no centering nor resizing
+        for receiver in receivers: # First set all states with signals blocked so receivers do not echo their scroll changes
+            with QtCore.QSignalBlocker(receiver):
+                receiver.scrollState = newState
+        for receiver in receivers: # Then resize all scenes
+            receiver.resize_scene()
+        if receivers:
+            self.on_scrollChanged() # Once for the splits of all receivers (their own signals were blocked)
 
         self._handlingScrollChangedSignal = False
 
@@ -1677,6 +2096,8 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
         :param fromViewer: :class:`SplitViewMdiChild` that initiated synching"""
         if not fromViewer:
             return
+        if len(self._child_widgets) <= 1: # Nothing to synch with a single subwindow
+            return
         newZoomFactor = fromViewer.zoomFactor
 
         sync_by = self.sync_zoom_by
@@ -1685,31 +2106,39 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
                                                         fromViewer.imageHeight,
                                                         sync_by)
 
-        changedWindow = fromViewer.parent()
-        windows = self._mdiArea.subWindowList()
-        for window in windows:
-            if window != changedWindow:
-                receiver = window.widget()
-                if receiver.sync_this_zoom:
-                    adjustment_factor = determineSyncAdjustmentFactor(sync_by,
-                                                                      sender_dimension,
-                                                                      receiver.imageWidth,
-                                                                      receiver.imageHeight)
-
-                    receiver.zoomFactor = newZoomFactor*adjustment_factor
-                    receiver.resize_scene()
+        if self._zoomReceivers is None:
+            self._zoomReceivers = [child for child in self._child_widgets if child.sync_this_zoom]
+        receivers = []
+        for receiver in self._zoomReceivers: # First set all zooms with signals blocked so receivers do not echo their transform changes
+            if receiver is fromViewer:
+                continue
+            zoomFactor = newZoomFactor*receiver.get_sync_adjustment_factor(sync_by, sender_dimension)
+            if abs(receiver.zoomFactor - zoomFactor) <= 1e-6: # Unchanged receivers need no rescaling nor resizing
+                continue
+            with QtCore.QSignalBlocker(receiver):
+                receiver.zoomFactor = zoomFactor
+            receivers.append(receiver)
+        for receiver in receivers: # Then resize all scenes
+            receiver.resize_scene()
         self.refreshPan()
 
+    def invalidateSyncReceivers(self):
+        """Forget the cached children synched by pan and zoom; rebuilt on the next synch (upon adding/closing a subwindow or toggling its synch)."""
+        self._panReceivers = None
+        self._zoomReceivers = None
+
     def refreshPan(self):
-        if self.activeMdiChild:
-            self.synchPan(self.activeMdiChild)
+        child = self.activeMdiChild
+        if child:
+            self.synchPan(child)
 
     def refreshPanDelayed(self, ms=0):
-        QtCore.QTimer.singleShot(ms, self.refreshPan)
+        QtCore.QTimer.singleShot(ms, QtCore.Qt.CoarseTimer, self.refreshPan) # Coarse: no need for a precise (1 ms) system timer
 
     def refreshZoom(self):
-        if self.activeMdiChild:
-            self.synchZoom(self.activeMdiChild)
+        child = self.activeMdiChild
+        if child:
+            self.synchZoom(child)
 
 
     # Methods from PyQt MDI Image Viewer left unaltered
@@ -1764,8 +2193,9 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
             All files (*)"
         fullpaths, _ = QtWidgets.QFileDialog.getOpenFileNames(self, "Select image(s) to open", last_accessed_fullpath, filters)
 
-        for fullpath in fullpaths:
-            self.loadFile(fullpath, None, None, None)
+        with self.batched_loads():
+            for fullpath in fullpaths:
+                self.loadFile(fullpath, None, None, None)
 
 
 
@@ -1774,15 +2204,18 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
         """Toggle subwindow scrollbar visibility."""
         checked = self._showScrollbarsAct.isChecked()
 
-        windows = self._mdiArea.subWindowList()
-        for window in windows:
-            child = window.widget()
-            child.enableScrollBars(checked)
+        self._mdiArea.setUpdatesEnabled(False) # One repaint of the area for all subwindows instead of one per subwindow
+        try:
+            for child in self._child_widgets:
+                child.enableScrollBars(checked)
+        finally:
+            self._mdiArea.setUpdatesEnabled(True)
 
     @QtCore.pyqtSlot()
     def toggleStatusbar(self):
         """Toggle status bar visibility."""
         self.statusBar().setVisible(self._showStatusbarAct.isChecked())
+        self.updateStatusBar() # Not updated while hidden
 
 
     @QtCore.pyqtSlot()
@@ -1809,25 +2242,20 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
             self._mdiArea.setActiveSubWindow(window)
 
 
-    def updateStatusBar(self):
-        """Update status bar."""
-        self.statusBar().setVisible(self._showStatusbarAct.isChecked())
-        imageViewer = self.activeMdiChild
-        if not imageViewer:
-            self._sbLabelName.setText("")
-            self._sbLabelSize.setText("")
-            self._sbLabelDimensions.setText("")
-            self._sbLabelDate.setText("")
-            self._sbLabelZoom.setText("")
+    def getStatusBarFileTexts(self, imageViewer):
+        """Get the status bar texts of the file of a viewer, cached on the viewer until its file changes.
 
-            self._sbLabelSize.hide()
-            self._sbLabelDimensions.hide()
-            self._sbLabelDate.hide()
-            self._sbLabelZoom.hide()
-            return
+        Spares a stat of the file and the formatting on every update of the status bar (for example, on every zoom).
+
+        Args:
+            imageViewer (SplitViewMdiChild): The viewer.
 
+        Returns:
+            texts (tuple of str): The texts of the name, size, dimensions, and date of the file.
+        """
         filename_main_topleft = imageViewer.currentFile
-        self._sbLabelName.setText(" %s " % filename_main_topleft)
+        if imageViewer._cachedStatusTexts is not None and imageViewer._cachedStatusFile == filename_main_topleft:
+            return imageViewer._cachedStatusTexts
 
         fi = QtCore.QFileInfo(filename_main_topleft)
         size = fi.size()
@@ -1844,17 +2272,42 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
         else:
             unit = "Bytes"
             fmt = " %d %s "
-        self._sbLabelSize.setText(fmt % (size, unit))
 
         pixmap = imageViewer.pixmap_main_topleft
-        self._sbLabelDimensions.setText(" %dx%dx%d " %
-                                        (pixmap.width(),
-                                         pixmap.height(),
-                                         pixmap.depth()))
-
-        self._sbLabelDate.setText(
-            " %s " %
-            fi.lastModified().toString(QtCore.Qt.SystemLocaleShortDate))
+
+        texts = (" %s " % filename_main_topleft,
+                 fmt % (size, unit),
+                 " %dx%dx%d " % (pixmap.width(), pixmap.height(), pixmap.depth()),
+                 " %s " % fi.lastModified().toString(QtCore.Qt.SystemLocaleShortDate))
+        imageViewer._cachedStatusFile = filename_main_topleft
+        imageViewer._cachedStatusTexts = texts
+        return texts
+
+    def updateStatusBar(self):
+        """Update status bar (skipped while hidden; its labels are created on its first show)."""
+        if not self._showStatusbarAct.isChecked():
+            return
+        self._ensureStatusBar()
+
+        imageViewer = self.activeMdiChild
+        if not imageViewer:
+            self._sbLabelName.setText("")
+            self._sbLabelSize.setText("")
+            self._sbLabelDimensions.setText("")
+            self._sbLabelDate.setText("")
+            self._sbLabelZoom.setText("")
+
+            self._sbLabelSize.hide()
+            self._sbLabelDimensions.hide()
+            self._sbLabelDate.hide()
+            self._sbLabelZoom.hide()
+            return
+
+        name_text, size_text, dimensions_text, date_text = self.getStatusBarFileTexts(imageViewer)
+        self._sbLabelName.setText(name_text)
+        self._sbLabelSize.setText(size_text)
+        self._sbLabelDimensions.setText(dimensions_text)
+        self._sbLabelDate.setText(date_text)
         self._sbLabelZoom.setText(" %0.f%% " % (imageViewer.zoomFactor*100,))
 
         self._sbLabelSize.show()
@@ -1903,6 +2356,13 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
     def writeSettings(self):
         """Write application settings."""
         settings = QtCore.QSettings()
+        settings.setValue(SETTING_PIXMAPCACHE,
+                          QtGui.QPixmapCache.cacheLimit())
+
+        for key in SETTINGS_KEYS_MAINWINDOW: # Remove ungrouped copies left by earlier versions so they do not go stale
+            settings.remove(key)
+
+        settings.beginGroup(SETTINGS_GROUP_MAINWINDOW)
         settings.setValue('pos', self.pos())
         settings.setValue('size', self.size())
         settings.setValue('windowgeometry', self.saveGeometry())
@@ -1916,6 +2376,9 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
                           self._synchZoomAct.isChecked())
         settings.setValue(SETTING_SYNCHPAN,
                           self._synchPanAct.isChecked())
+        settings.endGroup()
+
+        settings.sync() # Written out once here rather than whenever QSettings decides to
 
     def readSettings(self):
         """Read application settings."""
@@ -1926,8 +2389,14 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
 
         settings = QtCore.QSettings()
 
-        pos = settings.value('pos', QtCore.QPoint(100, 100))
-        size = settings.value('size', QtCore.QSize(1100, 600))
+        QtGui.QPixmapCache.setCacheLimit(settings.value(SETTING_PIXMAPCACHE, PIXMAP_CACHE_LIMIT_DEFAULT, type=int))
+
+        is_grouped = SETTINGS_GROUP_MAINWINDOW in settings.childGroups() # Settings written by earlier versions are not grouped
+        if is_grouped:
+            settings.beginGroup(SETTINGS_GROUP_MAINWINDOW)
+
+        pos = settings.value('pos', QtCore.QPoint(100, 100), type=QtCore.QPoint)
+        size = settings.value('size', QtCore.QSize(1100, 600), type=QtCore.QSize)
         self.move(pos)
         self.resize(size)
 
@@ -1936,27 +2405,31 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
         if settings.contains('windowstate'):
             self.restoreState(settings.value('windowstate'))
 
-        
         if scrollbars_always_checked_off_at_startup:
             self._showScrollbarsAct.setChecked(False)
         else:
             self._showScrollbarsAct.setChecked(
-                toBool(settings.value(SETTING_SCROLLBARS, False)))
+                settings.value(SETTING_SCROLLBARS, False, type=bool))
 
         if statusbar_always_checked_off_at_startup:
             self._showStatusbarAct.setChecked(False)
         else:
             self._showStatusbarAct.setChecked(
-                toBool(settings.value(SETTING_STATUSBAR, False)))
+                settings.value(SETTING_STATUSBAR, False, type=bool))
 
         if sync_always_checked_on_at_startup:
             self._synchZoomAct.setChecked(True)
             self._synchPanAct.setChecked(True)
         else:
             self._synchZoomAct.setChecked(
-                toBool(settings.value(SETTING_SYNCHZOOM, False)))
+                settings.value(SETTING_SYNCHZOOM, False, type=bool))
             self._synchPanAct.setChecked(
-                toBool(settings.value(SETTING_SYNCHPAN, False)))
+                settings.value(SETTING_SYNCHPAN, False, type=bool))
+
+        if is_grouped:
+            settings.endGroup()
+
+        self.statusBar().setVisible(self._showStatusbarAct.isChecked()) # Otherwise only set by toggleStatusbar
 
     def updateRecentFileSettings(self, filename_main_topleft, delete=False):
         """Update recent file list setting.
@@ -1967,20 +2440,21 @@ class MultiViewMainWindow(QtWidgets.QMainWindow):
         settings = QtCore.QSettings()
         
         try:
-            files = list(settings.value(SETTING_RECENTFILELIST, []))
+            files = settings.value(SETTING_RECENTFILELIST, [], type=list)
         except TypeError:
             files = []
 
+        files = deque(files[:MultiViewMainWindow.MaxRecentFiles], maxlen=MultiViewMainWindow.MaxRecentFiles) # Most recent first; the oldest drops off when full
+
         try:
             files.remove(filename_main_topleft)
         except ValueError:
             pass
 
         if not delete:
-            files.insert(0, filename_main_topleft)
-        del files[MultiViewMainWindow.MaxRecentFiles:]
+            files.appendleft(filename_main_topleft)
 
-        settings.setValue(SETTING_RECENTFILELIST, files)
+        settings.setValue(SETTING_RECENTFILELIST, list(files))
 
 
 
@@ -2021,8 +2495,9 @@ def main():
 
     # Load any predefined images:
     if args.paths:
-        for path in args.paths:
-            mainWin.loadFile(path)
+        with mainWin.batched_loads():
+            for path in args.paths:
+                mainWin.loadFile(path)
 
     dda = mainWin._splitview_creator.drag_drop_area
     preloadedImageCount = 0